@@ -14,11 +14,10 @@ project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
 def run_command(command, cwd=None):
-    """运行命令并返回输出"""
+    """运行命令（参数列表，不经过shell）并返回输出"""
     try:
         process = subprocess.run(
             command,
-            shell=True,
             check=True,
             text=True,
             stdout=subprocess.PIPE,
@@ -37,9 +36,8 @@ def generate_test_cases(api_doc_path, output_dir=None):
     if output_dir:
         cmd.extend(["-o", output_dir])
     
-    cmd_str = " ".join(cmd)
-    print(f"生成测试用例: {cmd_str}")
-    output = run_command(cmd_str, cwd=project_root)
+    print(f"生成测试用例: {' '.join(cmd)}")
+    output = run_command(cmd, cwd=project_root)
     print(output)
     
     # 返回生成的测试用例文件路径
@@ -61,9 +59,8 @@ def convert_to_postman(test_cases_path, output_file=None):
         output_file = os.path.splitext(test_cases_path)[0] + "_postman.json"
     
     cmd = [sys.executable, "src/bin/convert_to_postman.py", "-i", test_cases_path, "-o", output_file]
-    cmd_str = " ".join(cmd)
-    print(f"转换为Postman格式: {cmd_str}")
-    output = run_command(cmd_str, cwd=project_root)
+    print(f"转换为Postman格式: {' '.join(cmd)}")
+    output = run_command(cmd, cwd=project_root)
     print(output)
     
     if os.path.exists(output_file):
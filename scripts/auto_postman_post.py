@@ -6,6 +6,7 @@ import argparse
 import platform
 import time
 import json
+import shutil
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -13,65 +14,106 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
-def run_command(command, cwd=None):
-    """运行命令并返回输出"""
-    try:
-        process = subprocess.run(
-            command,
-            shell=True,
-            check=True,
-            text=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=cwd
-        )
-        return process.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"命令执行失败: {e}")
-        print(f"错误输出: {e.stderr}")
-        sys.exit(1)
+from scripts.generate_post_testcases import generate_post_testcases
+from src.utils.postman_converter import convert_test_cases_to_postman
+from src.utils.json_utils import write_json_file
+
+# 默认输出目录
+REPORTS_DIR = os.path.join(project_root, "reports")
+
+# 缓存已找到的Postman安装路径，避免每次运行都探测候选路径
+POSTMAN_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".api_test_ai", "postman_path.json")
+
+# 常见的Windows安装路径，跳过未设置的环境变量
+POSTMAN_WINDOWS_CANDIDATES = tuple(
+    os.path.join(os.environ[key], "Postman", "Postman.exe")
+    for key in ('LOCALAPPDATA', 'PROGRAMFILES', 'PROGRAMFILES(X86)')
+    if os.environ.get(key)
+)
+
+# 本次运行中已探测或已写入的文件路径是否存在
+_fs_cache = {}
+
+def cached_exists(path):
+    """带进程内缓存的os.path.exists"""
+    if path not in _fs_cache:
+        _fs_cache[path] = os.path.exists(path)
+    return _fs_cache[path]
+
+def mark_written(path):
+    """记录本脚本刚写入的文件，后续无需再探测"""
+    _fs_cache[path] = True
 
 def generate_test_cases(api_doc_path, output_dir=None, base_url="https://api.ucloud.cn"):
-    """生成POST测试用例"""
-    cmd = [sys.executable, "scripts/generate_post_testcases.py", "-f", api_doc_path, "-u", base_url]
-    if output_dir:
-        cmd.extend(["-o", os.path.join(output_dir, "test_cases.json")])
-    
-    cmd_str = " ".join(cmd)
-    print(f"生成POST测试用例: {cmd_str}")
-    output = run_command(cmd_str, cwd=project_root)
-    print(output)
-    
-    # 返回生成的测试用例文件路径
+    """生成POST测试用例，返回测试用例文件路径和测试用例数据"""
+    # 确定测试用例文件路径
     if output_dir:
         test_cases_path = os.path.join(output_dir, "test_cases.json")
     else:
-        test_cases_path = os.path.join(project_root, "reports", "test_cases.json")
+        test_cases_path = os.path.join(REPORTS_DIR, "test_cases.json")
+    
+    print(f"生成POST测试用例: {api_doc_path} -> {test_cases_path}")
+    test_cases = generate_post_testcases(api_doc_path, test_cases_path, base_url)
     
-    if os.path.exists(test_cases_path):
+    if cached_exists(test_cases_path):
         print(f"测试用例生成成功: {test_cases_path}")
-        return test_cases_path
+        return test_cases_path, test_cases
     else:
         print("无法找到生成的测试用例文件")
         sys.exit(1)
 
-def convert_to_postman(test_cases_path, output_file=None):
-    """转换测试用例为Postman格式"""
+def convert_to_postman(test_cases_path, test_cases, output_file=None):
+    """转换测试用例为Postman格式，直接使用内存中的测试用例数据，不再重新读取文件"""
     if not output_file:
-        output_file = os.path.splitext(test_cases_path)[0] + "_postman.json"
+        test_cases_file = Path(test_cases_path)
+        output_file = str(test_cases_file.with_name(test_cases_file.stem + "_postman.json"))
     
-    cmd = [sys.executable, "src/bin/convert_to_postman.py", "-i", test_cases_path, "-o", output_file]
-    cmd_str = " ".join(cmd)
-    print(f"转换为Postman格式: {cmd_str}")
-    output = run_command(cmd_str, cwd=project_root)
-    print(output)
-    
-    if os.path.exists(output_file):
-        print(f"Postman集合文件生成成功: {output_file}")
-        return output_file
-    else:
-        print("无法找到生成的Postman集合文件")
+    print(f"转换为Postman格式: {test_cases_path} -> {output_file}")
+    try:
+        convert_test_cases_to_postman(test_cases, output_file)
+    except Exception as e:
+        print(f"转换失败: {e}")
         sys.exit(1)
+    
+    # 转换失败时会抛出异常，无需再检查文件是否存在
+    mark_written(output_file)
+    print(f"Postman集合文件生成成功: {output_file}")
+    return output_file
+
+def load_cached_postman_path():
+    """读取缓存的Postman安装路径，缓存不存在或已失效时返回None"""
+    try:
+        with open(POSTMAN_PATH_CACHE, 'r', encoding='utf-8') as f:
+            path = json.load(f).get("path")
+    except (OSError, ValueError, AttributeError):
+        return None
+    
+    if path and cached_exists(path):
+        return path
+    return None
+
+def save_cached_postman_path(path):
+    """缓存找到的Postman安装路径"""
+    try:
+        os.makedirs(os.path.dirname(POSTMAN_PATH_CACHE), exist_ok=True)
+        with open(POSTMAN_PATH_CACHE, 'w', encoding='utf-8') as f:
+            json.dump({"path": path}, f)
+    except OSError as e:
+        print(f"无法缓存Postman安装路径: {e}")
+
+def find_windows_postman():
+    """查找Windows上的Postman可执行文件，优先使用缓存和PATH"""
+    path = load_cached_postman_path()
+    if path:
+        return path
+    
+    path = shutil.which("Postman") or shutil.which("Postman.exe")
+    if not path:
+        path = next((p for p in POSTMAN_WINDOWS_CANDIDATES if cached_exists(p)), None)
+    
+    if path:
+        save_cached_postman_path(path)
+    return path
 
 def open_postman(postman_file):
     """打开Postman并显示如何导入文件的说明"""
@@ -84,17 +126,9 @@ def open_postman(postman_file):
         if system == "Darwin":  # macOS
             subprocess.Popen(["open", "-a", "Postman"])
         elif system == "Windows":
-            # 尝试常见的Windows安装路径
-            postman_paths = [
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), "Postman", "Postman.exe"),
-                os.path.join(os.environ.get('PROGRAMFILES', ''), "Postman", "Postman.exe"),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), "Postman", "Postman.exe")
-            ]
-            
-            for path in postman_paths:
-                if os.path.exists(path):
-                    subprocess.Popen([path])
-                    break
+            path = find_windows_postman()
+            if path:
+                subprocess.Popen([path])
             else:
                 print("无法找到Postman安装位置，请手动打开Postman")
         elif system == "Linux":
@@ -115,9 +149,6 @@ def open_postman(postman_file):
 
 def create_environment_file(postman_file, env_vars=None):
     """为Postman创建环境变量文件"""
-    if not env_vars:
-        env_vars = {}
-        
     # 确保基本环境变量存在，如果用户没有提供则使用默认值
     default_vars = {
         "Region": "cn-bj2",
@@ -129,12 +160,11 @@ def create_environment_file(postman_file, env_vars=None):
     }
     
     # 将默认值与用户提供的值合并，用户提供的值优先
-    for key, value in default_vars.items():
-        if key not in env_vars:
-            env_vars[key] = value
+    env_vars = {**default_vars, **(env_vars or {})}
     
     # 创建环境变量文件
-    env_file = os.path.splitext(postman_file)[0] + "_environment.json"
+    postman_path = Path(postman_file)
+    env_file = str(postman_path.with_name(postman_path.stem + "_environment.json"))
     
     env_data = {
         "id": "auto-generated-env",
@@ -150,8 +180,8 @@ def create_environment_file(postman_file, env_vars=None):
         "_postman_variable_scope": "environment"
     }
     
-    with open(env_file, 'w', encoding='utf-8') as f:
-        json.dump(env_data, f, indent=2, ensure_ascii=False)
+    write_json_file(env_data, env_file)
+    mark_written(env_file)
     
     print(f"环境变量文件创建成功: {env_file}")
     return env_file
@@ -167,11 +197,14 @@ def main():
     
     print("=== 自动化API测试工作流开始（强制POST请求）===")
     
+    # 启动时一次性创建输出目录
+    os.makedirs(args.output or REPORTS_DIR, exist_ok=True)
+    
     # 1. 生成测试用例
-    test_cases_path = generate_test_cases(args.file, args.output, args.url)
+    test_cases_path, test_cases = generate_test_cases(args.file, args.output, args.url)
     
     # 2. 转换为Postman格式
-    postman_file = convert_to_postman(test_cases_path)
+    postman_file = convert_to_postman(test_cases_path, test_cases)
     
     # 3. 创建环境变量文件
     if args.url:
@@ -1,11 +1,41 @@
 #!/usr/bin/env python3
 import os
 import shutil
-import glob
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 
+# unlinkat(2) relative to an already-open directory avoids re-walking the full
+# path for every file; only available on platforms that support dir_fd
+USE_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def remove_file(file_path, root_dir, dir_fd=None):
+    """
+    Delete a single file, reporting the outcome.
+    
+    Args:
+        file_path: Full path of the file to delete
+        root_dir: Project root, used for reporting relative paths
+        dir_fd: Optional open descriptor of the file's directory
+    
+    Returns:
+        True if the file was deleted, False otherwise
+    """
+    try:
+        if dir_fd is None:
+            os.unlink(file_path)
+        else:
+            os.unlink(os.path.basename(file_path), dir_fd=dir_fd)
+        print(f"已删除: {os.path.relpath(file_path, root_dir)}")
+        return True
+    except Exception as e:
+        print(f"删除文件 {file_path} 时出错: {str(e)}")
+        return False
+
+
 def cleanup_files():
     """
     Clean up temporary files generated during API testing process.
@@ -16,18 +46,18 @@ def cleanup_files():
     # Get the project root directory
     root_dir = Path(__file__).parent.parent.absolute()
     
-    # Files and directories to clean
+    # Files to clean, as (directory, filename predicate) pairs
     cleanup_targets = [
-        # Temporary JSON files
-        os.path.join(root_dir, "reports", "test_cases_*.json"),
-        os.path.join(root_dir, "reports", "*.html"),
-        os.path.join(root_dir, "reports", "*.pdf"),
+        # Temporary JSON files and reports
+        (os.path.join(root_dir, "reports"),
+         lambda name: name.endswith((".html", ".pdf")) or
+                      (name.startswith("test_cases_") and name.endswith(".json"))),
         # Log files
-        os.path.join(root_dir, "logs", "*.log"),
+        (os.path.join(root_dir, "logs"), lambda name: name.endswith(".log")),
         # Extracted API schemas
-        os.path.join(root_dir, "extracted_schemas", "*.json"),
+        (os.path.join(root_dir, "extracted_schemas"), lambda name: name.endswith(".json")),
         # Temporary environment files
-        os.path.join(root_dir, "*.json"),
+        (str(root_dir), lambda name: name.endswith(".json")),
     ]
     
     # Create directories if they don't exist
@@ -37,16 +67,30 @@ def cleanup_files():
     # Count of deleted files
     deleted_count = 0
     
-    # Clean up files
-    for target in cleanup_targets:
-        for file_path in glob.glob(target):
+    # Delete files concurrently so the unlink syscalls overlap
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for directory, matches in cleanup_targets:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY) if USE_DIR_FD else None
             try:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                    print(f"已删除: {os.path.relpath(file_path, root_dir)}")
-                    deleted_count += 1
-            except Exception as e:
-                print(f"删除文件 {file_path} 时出错: {str(e)}")
+                remove = partial(remove_file, root_dir=root_dir, dir_fd=dir_fd)
+                
+                # Dispatch each match as soon as the directory listing yields it
+                futures = []
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Hidden files are skipped, as glob patterns used to do
+                        if entry.name.startswith(".") or not matches(entry.name):
+                            continue
+                        try:
+                            if entry.is_file():
+                                futures.append(executor.submit(remove, entry.path))
+                        except OSError as e:
+                            print(f"删除文件 {entry.path} 时出错: {str(e)}")
+                
+                deleted_count += sum(future.result() for future in futures)
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
     
     print(f"清理完成! 共删除 {deleted_count} 个临时文件。")
     
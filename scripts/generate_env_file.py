@@ -55,49 +55,46 @@ def main():
     """Main entry point"""
     args = parse_arguments()
     
-    # Collect environment variables
-    env_vars = {}
-    
     # 1. Load from file if provided
+    file_vars = {}
     if args.file:
         try:
             with open(args.file, 'r', encoding='utf-8') as f:
-                file_vars = json.load(f)
+                file_data = json.load(f)
             
             # Handle different file formats
-            if isinstance(file_vars, dict):
+            if isinstance(file_data, dict):
                 # Simple key-value dictionary
-                env_vars.update(file_vars)
-            elif 'values' in file_vars:
+                file_vars = file_data
+            elif 'values' in file_data:
                 # Postman environment format
-                for var in file_vars.get('values', []):
-                    if 'key' in var and 'value' in var:
-                        env_vars[var['key']] = var['value']
+                file_vars = {var['key']: var['value'] for var in file_data.get('values', [])
+                             if 'key' in var and 'value' in var}
             
             logger.info(f"Loaded environment variables from {args.file}")
         except Exception as e:
             logger.error(f"Error loading environment variables from {args.file}: {str(e)}")
     
     # 2. Add command line variables
-    if args.vars:
-        for var_str in args.vars:
-            if '=' in var_str:
-                key, value = var_str.split('=', 1)
-                env_vars[key] = value
-                logger.info(f"Added environment variable from command line: {key}")
+    cli_vars = {}
+    for var_str in args.vars or []:
+        if '=' in var_str:
+            key, value = var_str.split('=', 1)
+            cli_vars[key] = value
+            logger.info(f"Added environment variable from command line: {key}")
     
     # 3. Add specific variables if provided
-    if args.url:
-        env_vars['base_url'] = args.url
-    
-    if args.region:
-        env_vars['Region'] = args.region
-    
-    if args.zone:
-        env_vars['Zone'] = args.zone
-    
-    if args.project_id:
-        env_vars['ProjectId'] = args.project_id
+    specific_vars = {
+        key: value for key, value in (
+            ('base_url', args.url),
+            ('Region', args.region),
+            ('Zone', args.zone),
+            ('ProjectId', args.project_id),
+        ) if value
+    }
+    
+    # Later sources take precedence: file < command line < specific flags
+    env_vars = {**file_vars, **cli_vars, **specific_vars}
     
     # Generate the environment file
     output_path = generate_environment_file(
@@ -3,10 +3,15 @@ import os
 import sys
 import json
 import argparse
+import copy
+import functools
 import random
 import string
 import datetime
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from json.encoder import encode_basestring
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -14,15 +19,203 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
+from src.utils.cit_variants import pairwise_variants
+from src.utils.json_utils import dumps_pretty
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 从Markdown文档标题中提取API描述和名称的正则表达式，模块加载时编译一次
+_TITLE_RE = re.compile(r'(.+)-(\w+)')
+
+_ASCII_LOWER = string.ascii_lowercase
+_DEFAULT_ARRAY = ("item_1", "item_2", "item_3")
+
+# 测试值随机后缀的长度，以及后缀池每次批量生成的数量
+_SUFFIX_LENGTH = 5
+_SUFFIX_BATCH = 512
+_SUFFIX_POOL = []
+
+# 测试用例共用的请求头和通用参数模板；请求头只读共享，body每次复制后再填充
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_BASE_BODY = {
+    "Region": "{{Region}}",
+    "Zone": "{{Zone}}",
+    "ProjectId": "{{ProjectId}}",
+    "PublicKey": "{{PublicKey}}",
+    "PrivateKey": "{{PrivateKey}}"
+}
+
+# 多数测试用例共用的预期结果，所有用例直接引用同一对象，任何地方都不能修改它们
+# （正常路径测试的预期结果会被幂等性、性能、文档校验测试修改，因此仍然每次新建）
+_EXPECTED_OK = {"status": 200, "body": {"RetCode": 0}}
+_EXPECTED_ERROR = {"status": 400, "body": {"RetCode": {"$ne": 0}}}
+_EXPECTED_REJECTED = {"status": 200, "body": {"RetCode": {"$ne": 0}}}
+
+# 由模板提供、生成参数时需要跳过的通用参数
+_COMMON_PARAMS = frozenset(_BASE_BODY)
+_COMMON_PARAMS_PLUS_ACTION = _COMMON_PARAMS | {"Action"}
+
 def generate_random_string(length=10):
     """生成随机字符串"""
-    letters = string.ascii_lowercase
-    return ''.join(random.choice(letters) for i in range(length))
+    return ''.join(random.choices(_ASCII_LOWER, k=length))
+
+def next_random_suffix():
+    """取一个随机后缀；后缀池用完时一次性批量生成一批"""
+    if not _SUFFIX_POOL:
+        chars = generate_random_string(_SUFFIX_LENGTH * _SUFFIX_BATCH)
+        _SUFFIX_POOL.extend(chars[i:i + _SUFFIX_LENGTH] for i in range(0, len(chars), _SUFFIX_LENGTH))
+    return _SUFFIX_POOL.pop()
+
+def generate_random_items(count, length):
+    """生成count个带随机后缀的数组元素，所有后缀一次性生成"""
+    suffixes = generate_random_string(count * length)
+    return [f"item_{suffixes[i:i + length]}" for i in range(0, count * length, length)]
+
+# 参数类型到类别的映射；生成用例前每个参数计算一次，存入参数的"_ntype"字段
+_DATA_TYPE_CATEGORIES = {
+    "number": "number",
+    "integer": "number",
+    "int": "number",
+    "string": "string",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "array": "array"
+}
+
+# 类型错误测试中，各类别参数被故意设置的错误类型取值
+_INVALID_TYPE_VALUES = {
+    "string": 12345,
+    "number": "这不是数字",
+    "boolean": "不是布尔值",
+    "array": "不是数组"
+}
+
+# 边界值测试中的边界类型，按数据类型分为预期成功的有效边界值和预期失败的无效边界值
+_VALID_BOUNDARIES = {
+    "number": ("max", "min", "zero", "negative"),
+    "string": ("empty", "special", "spaces", "emoji", "multilingual")
+}
+_ERROR_BOUNDARIES = {
+    "number": ("max_plus_one", "min_minus_one", "large"),
+    "string": ("long",)
+}
+
+# 边界值和安全测试中使用的固定字符串
+_LONG_STRING = "a" * 1000
+_SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;':\",./<>?\\"
+_SPACES_STRING = "   空格前后   "
+_EMOJI_STRING = "测试Emoji😀👍🎉"
+_MULTILINGUAL_STRING = "English中文日本語한국어"
+_INJECTION = "' OR 1=1; -- <script>alert('XSS')</script>"
+_INJECTION_ARRAY = ("' OR 1=1; --", "<script>alert('XSS')</script>")
+
+# (数据类型, 边界类型) -> (取值, 用例描述, 是否预期请求失败)
+_BOUNDARY_SPECS = {
+    ("number", "max"): (2147483647, "最大值(INT_MAX)", False),
+    ("number", "max_plus_one"): (2147483648, "最大值+1(INT_MAX+1)", True),
+    ("number", "min"): (-2147483648, "最小值(INT_MIN)", False),
+    ("number", "min_minus_one"): (-2147483649, "最小值-1(INT_MIN-1)", True),
+    ("number", "zero"): (0, "零值(0)", False),
+    ("number", "negative"): (-1, "负值(-1)", False),
+    ("number", "large"): (9999999999, "超大值(9999999999)", True),
+    ("string", "empty"): ("", "空字符串", False),
+    ("string", "long"): (_LONG_STRING, "超长字符串(1000字符)", True),
+    ("string", "special"): (_SPECIAL_CHARS, "特殊字符", False),
+    ("string", "spaces"): (_SPACES_STRING, "空格前后", False),
+    ("string", "emoji"): (_EMOJI_STRING, "Emoji字符", False),
+    ("string", "multilingual"): (_MULTILINGUAL_STRING, "多语言字符", False)
+}
+
+# 按参数类型生成取值：随机取值用于正常路径测试，固定取值用于只填必填参数的用例
+_RANDOM_VALUE_GENERATORS = {
+    "string": lambda name: f"test_{name}_{next_random_suffix()}",
+    "number": lambda name: random.randint(1, 100),
+    "integer": lambda name: random.randint(1, 100),
+    "int": lambda name: random.randint(1, 100),
+    "boolean": lambda name: bool(random.getrandbits(1)),
+    "bool": lambda name: bool(random.getrandbits(1)),
+    "array": lambda name: list(_DEFAULT_ARRAY)
+}
+
+_REQUIRED_VALUE_GENERATORS = {
+    "string": lambda name: f"test_{name}",
+    "number": lambda name: 1,
+    "integer": lambda name: 1,
+    "int": lambda name: 1,
+    "boolean": lambda name: True,
+    "bool": lambda name: True,
+    "array": lambda name: ["item_1"]
+}
+
+# 已知参数类型的规范字符串；解析出的类型统一映射到这些常量实例，后续比较和查表可走同一对象的快速路径
+_TYPE_CANON = {t: t for t in ("string", "number", "integer", "int", "boolean", "bool", "array")}
+
+# 需要解析参数表格的文档章节
+_MD_TABLE_SECTIONS = ('Request Parameters', 'Response Elements')
+
+def _scan_md_tables(content):
+    """
+    单次遍历Markdown文档，按所在章节收集参数表格
+    
+    任意级别的标题行（#、##、...）都会结束上一节；同名章节只收集第一次出现的内容。
+    表格中的表头（分隔行的上一行）和分隔行会被跳过
+    
+    Args:
+        content: Markdown文档内容
+        
+    Returns:
+        章节标题到参数字典列表的映射，只包含文档中出现的_MD_TABLE_SECTIONS章节
+    """
+    rows_by_section = {}
+    rows = None
+    for line in content.splitlines():
+        if line.startswith('#'):
+            header = line.lstrip('#').strip()
+            if header in _MD_TABLE_SECTIONS and header not in rows_by_section:
+                rows = rows_by_section[header] = []
+            else:
+                rows = None
+            continue
+        if rows is None:
+            continue
+        line = line.strip()
+        if not line.startswith('|'):
+            continue
+        # 只需要前4列，多余的列留在最后一段里不再切分和strip
+        cells = line.strip('|').split('|', 4)
+        if len(cells) < 4:
+            continue
+        # 参数名驻留后与模板、常量中的同名字符串是同一对象，作为字典键查找和比较时可走指针相等的快速路径
+        param_name = sys.intern(cells[0].strip())
+        if param_name.startswith('---'):
+            # 分隔行的上一行是表头
+            if rows:
+                rows.pop()
+            continue
+        param_type = cells[1].strip().lower()
+        rows.append((param_name, _TYPE_CANON.get(param_type, param_type), cells[2].strip(), cells[3]))
+    
+    tables = {}
+    for header, rows in rows_by_section.items():
+        tables[header] = [
+            {
+                "name": param_name,
+                "type": param_type,
+                "description": description,
+                "required": "yes" in required.lower()
+            }
+            for param_name, param_type, description, required in rows
+            if param_name and param_type
+        ]
+    return tables
 
 def parse_markdown_api_doc(md_file_path):
     """
     解析Markdown格式的API文档，提取API信息和参数
     
+    解析结果按(绝对路径, 修改时间, 文件大小)缓存，文件未变化时不会重复解析
+    
     Args:
         md_file_path: Markdown文件路径
         
@@ -30,12 +223,24 @@ def parse_markdown_api_doc(md_file_path):
         解析后的API信息字典，包含路径、描述和参数列表
     """
     try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        stat = os.stat(md_file_path)
+    except OSError as e:
+        logger.error("解析Markdown文件时出错: %s", e)
+        return None
+    
+    api_info = _parse_markdown_api_doc_cached(os.path.abspath(md_file_path), stat.st_mtime_ns, stat.st_size)
+    # 缓存中的结果会被多次返回，交给调用方一份副本以免修改影响缓存
+    return copy.deepcopy(api_info)
+
+@functools.lru_cache(maxsize=256)
+def _parse_markdown_api_doc_cached(md_file_path, mtime_ns, size):
+    """解析Markdown API文档，mtime_ns和size仅作为缓存键使用"""
+    try:
+        content = Path(md_file_path).read_text(encoding='utf-8')
         
         # 提取API名称和描述
         first_line = content.strip().split('\n')[0]
-        api_title_match = re.search(r'(.+)-(\w+)', first_line)
+        api_title_match = _TITLE_RE.search(first_line)
         
         api_description = ""
         api_name = ""
@@ -45,44 +250,24 @@ def parse_markdown_api_doc(md_file_path):
             api_description = api_title_match.group(1).strip()
             api_name = api_title_match.group(2).strip()
             api_path = "/" + api_name
-            print(f"找到API: 名称={api_name}, 路径={api_path}, 描述={api_description}")
+            logger.info("找到API: 名称=%s, 路径=%s, 描述=%s", api_name, api_path, api_description)
         else:
-            print("无法从Markdown文件中提取API名称和路径，将使用默认值")
+            logger.warning("无法从Markdown文件中提取API名称和路径，将使用默认值")
             api_name = "DescribeUDBInstance"
             api_path = "/DescribeUDBInstance"
             api_description = "获取UDB实例信息"
         
-        # 查找Request Parameters部分
-        request_params_section = re.search(r'# Request Parameters(.*?)(?:# |$)', content, re.DOTALL)
+        # 一次遍历文档，同时收集Request Parameters和Response Elements两部分的表格
+        tables = _scan_md_tables(content)
         parameters = []
         
-        if request_params_section:
-            params_content = request_params_section.group(1)
-            
-            # 使用正则表达式解析Markdown表格
-            param_rows = re.findall(r'\|(.*?)\|(.*?)\|(.*?)\|(.*?)\|', params_content)
-            
-            if len(param_rows) > 1:  # 确保表头之后有数据行
-                # 跳过表头行和分隔行
-                for row in param_rows[2:]:
-                    if len(row) >= 4:
-                        param_name = row[0].strip()
-                        param_type = row[1].strip().lower()
-                        description = row[2].strip()
-                        required = "yes" in row[3].strip().lower()
-                        
-                        if param_name and param_type and not param_name.startswith('---'):
-                            parameters.append({
-                                "name": param_name,
-                                "type": param_type,
-                                "description": description,
-                                "required": required
-                            })
-                            print(f"解析到参数: {param_name}, 类型: {param_type}, 必填: {required}")
+        for param in tables.get('Request Parameters', []):
+            parameters.append(param)
+            logger.debug("解析到参数: %s, 类型: %s, 必填: %s", param['name'], param['type'], param['required'])
         
         # 确保至少有一些参数
         if not parameters:
-            print("警告：未找到任何参数，将使用基本参数")
+            logger.warning("未找到任何参数，将使用基本参数")
             parameters = [
                 {"name": "Action", "type": "string", "required": True, "description": f"API名称，固定值为{api_name}"},
                 {"name": "Region", "type": "string", "required": True, "description": "地域"},
@@ -100,37 +285,15 @@ def parse_markdown_api_doc(md_file_path):
                     "description": f"API名称，固定值为{api_name}"
                 })
         
-        # 查找Response Elements部分
-        response_section = re.search(r'# Response Elements(.*?)(?:# |$)', content, re.DOTALL)
+        # Response Elements部分
         response_params = []
         
-        if response_section:
-            response_content = response_section.group(1)
-            
-            # 使用正则表达式解析Markdown表格
-            resp_rows = re.findall(r'\|(.*?)\|(.*?)\|(.*?)\|(.*?)\|', response_content)
-            
-            if len(resp_rows) > 1:  # 确保表头之后有数据行
-                # 跳过表头行和分隔行
-                for row in resp_rows[2:]:
-                    if len(row) >= 4:
-                        param_name = row[0].strip()
-                        param_type = row[1].strip().lower()
-                        description = row[2].strip()
-                        required = "yes" in row[3].strip().lower()
-                        
-                        if param_name and param_type and not param_name.startswith('---'):
-                            response_params.append({
-                                "name": param_name,
-                                "type": param_type,
-                                "description": description,
-                                "required": required
-                            })
-                            print(f"解析到响应参数: {param_name}, 类型: {param_type}, 必填: {required}")
+        for param in tables.get('Response Elements', []):
+            response_params.append(param)
+            logger.debug("解析到响应参数: %s, 类型: %s, 必填: %s", param['name'], param['type'], param['required'])
         
         # 打印找到的所有参数
-        print(f"总共解析到请求参数 {len(parameters)} 个")
-        print(f"总共解析到响应参数 {len(response_params)} 个")
+        logger.info("总共解析到请求参数 %d 个, 响应参数 %d 个", len(parameters), len(response_params))
             
         return {
             "path": api_path,
@@ -140,12 +303,315 @@ def parse_markdown_api_doc(md_file_path):
             "responses": response_params
         }
     except Exception as e:
-        print(f"解析Markdown文件时出错: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("解析Markdown文件时出错: %s", e)
         return None
 
-def generate_post_testcases(api_file, output_file, base_url):
+def _load_endpoints_from_md(api_file):
+    """从Markdown API文档加载端点"""
+    api_info = parse_markdown_api_doc(api_file)
+    if api_info and api_info["path"]:
+        return [{
+            "path": api_info["path"],
+            "method": "POST",
+            "name": api_info["name"],
+            "description": api_info["description"],
+            "parameters": api_info["parameters"],
+            "responses": api_info.get("responses", [])
+        }]
+    return []
+
+def _load_endpoints_from_json(api_file):
+    """从JSON API描述文件加载端点"""
+    try:
+        with open(api_file, 'r', encoding='utf-8') as f:
+            api_data = json.load(f)
+            
+        if "endpoints" in api_data:
+            return api_data.get("endpoints", [])
+    except Exception as e:
+        logger.error("读取JSON文件时出错: %s", e)
+    return []
+
+def _load_endpoints_default(api_file):
+    """不支持的文件类型，使用默认测试端点"""
+    logger.warning("不支持的文件类型: %s，使用默认测试端点", os.path.splitext(api_file)[1])
+    return [{
+        "path": "/api/test",
+        "method": "POST",
+        "description": "Default test endpoint"
+    }]
+
+# 文件扩展名（小写）到端点加载函数的映射
+_FILE_HANDLERS = {
+    '.md': _load_endpoints_from_md,
+    '.json': _load_endpoints_from_json
+}
+
+# 标准结构测试用例的键顺序；共享的请求头和预期结果只序列化一次，按在用例中的缩进层级保存
+_CASE_KEYS = ["name", "description", "request", "expected", "category"]
+_REQUEST_KEYS = ["path", "method", "headers", "body"]
+_HEADERS_JSON = dumps_pretty(_JSON_HEADERS).replace('\n', '\n    ')
+_SHARED_EXPECTED_JSON = {
+    id(expected): dumps_pretty(expected).replace('\n', '\n  ')
+    for expected in (_EXPECTED_OK, _EXPECTED_ERROR, _EXPECTED_REJECTED)
+}
+
+def _dumps_test_case(test_case):
+    """
+    将单个测试用例序列化为缩进JSON，结果与dumps_pretty(test_case)相同
+    
+    标准结构的用例按固定骨架拼接：字符串字段直接编码，共享的请求头和预期结果使用预先序列化的片段，
+    只有请求体和非共享的预期结果需要完整序列化；其他结构的用例交给dumps_pretty处理
+    """
+    request = test_case["request"]
+    if list(test_case) != _CASE_KEYS or list(request) != _REQUEST_KEYS or request["headers"] is not _JSON_HEADERS:
+        return dumps_pretty(test_case)
+    
+    expected = test_case["expected"]
+    expected_json = _SHARED_EXPECTED_JSON.get(id(expected))
+    if expected_json is None:
+        expected_json = dumps_pretty(expected).replace('\n', '\n  ')
+    return ''.join((
+        '{\n  "name": ', encode_basestring(test_case["name"]),
+        ',\n  "description": ', encode_basestring(test_case["description"]),
+        ',\n  "request": {\n    "path": ', encode_basestring(request["path"]),
+        ',\n    "method": ', encode_basestring(request["method"]),
+        ',\n    "headers": ', _HEADERS_JSON,
+        ',\n    "body": ', dumps_pretty(request["body"]).replace('\n', '\n    '),
+        '\n  },\n  "expected": ', expected_json,
+        ',\n  "category": ', encode_basestring(test_case["category"]),
+        '\n}'
+    ))
+
+def dump_test_cases(test_cases, f):
+    """
+    逐个测试用例写出缩进JSON
+    
+    输出与一次性序列化整个字典相同，但不需要先在内存中拼出完整的JSON字符串
+    
+    Args:
+        test_cases: generate_post_testcases生成的测试用例字典
+        f: 写入的文本文件对象
+    """
+    f.write('{')
+    for index, (endpoint_key, data) in enumerate(test_cases.items()):
+        f.write(',\n  ' if index else '\n  ')
+        f.write(dumps_pretty(endpoint_key))
+        f.write(': {\n    "endpoint": ')
+        # JSON编码后的字符串不含原始换行符，按行追加缩进是安全的
+        f.write(dumps_pretty(data["endpoint"]).replace('\n', '\n    '))
+        f.write(',\n    "test_cases": [')
+        for case_index, test_case in enumerate(data["test_cases"]):
+            f.write(',\n      ' if case_index else '\n      ')
+            f.write(_dumps_test_case(test_case).replace('\n', '\n      '))
+        f.write('\n    ]\n  }' if data["test_cases"] else ']\n  }')
+    f.write('\n}' if test_cases else '}')
+
+def _generate_endpoint_test_cases(endpoint, cit=False):
+    """
+    为单个API端点生成所有类别的测试用例
+    
+    Args:
+        endpoint: 端点描述字典（路径、名称、参数、响应字段等）
+        cit: 是否按两两组合覆盖生成边界值组合测试用例
+        
+    Returns:
+        (端点键, 包含端点信息和测试用例列表的字典)
+    """
+    path = endpoint.get("path", "").strip()
+    method = "POST"  # 强制使用POST
+    api_name = endpoint.get("name", "")
+    description = endpoint.get("description", "")
+    parameters = endpoint.get("parameters", [])
+    responses = endpoint.get("responses", [])
+    endpoint_key = f"{method} {path}"
+    
+    # 提取名称（通常是路径的最后一段或API名称）
+    name = api_name if api_name else path.strip('/').split('/')[-1]
+    
+    # 预先对参数分类一次，后续各类测试只遍历需要的子集（保持参数原有顺序）
+    real_params = []
+    for param in parameters:
+        if param.get("name", "") not in _COMMON_PARAMS:
+            param_type = param.get("type", "").lower()
+            real_params.append((param, _TYPE_CANON.get(param_type, param_type)))
+            param["_ntype"] = _DATA_TYPE_CATEGORIES.get(param_type)
+    optional_params = [(param, param_type) for param, param_type in real_params if not param.get("required", False)]
+    required_params = [param for param in parameters if param.get("required", False)]
+    required_body = _build_required_body(parameters, name)
+    invalid_type_params = [param for param, _ in real_params if param.get("name", "") not in _COMMON_PARAMS_PLUS_ACTION]
+    data_type_params = [(param, param["_ntype"]) for param, _ in real_params if param["_ntype"]]
+    boundary_params = [(param, param["_ntype"]) for param, _ in real_params if param["_ntype"] in _VALID_BOUNDARIES]
+    
+    # 测试用例按类别依次生成，生成时直接标记类别并加入扁平列表
+    flat_test_cases = []
+    
+    def add_test(category, test_case):
+        test_case["category"] = category
+        flat_test_cases.append(test_case)
+    
+    # 1. 等价类测试
+    logger.debug("生成 %s 的等价类测试...", api_name)
+    
+    # 1.1 正常请求测试（所有参数有效值）
+    normal_test = create_normal_test(path, method, description, parameters, name)
+    add_test("等价类测试", normal_test)
+    
+    # 1.2 仅必填参数测试
+    required_only_test = create_required_only_test(path, method, description, parameters, name, required_body)
+    add_test("等价类测试", required_only_test)
+    
+    # 1.3 部分选填参数测试
+    partial_optional_test = create_normal_test(path, method, description, parameters, name)
+    partial_optional_test["name"] = f"{name}_部分选填参数测试"
+    partial_optional_test["description"] = "测试部分选填参数"
+    add_test("等价类测试", partial_optional_test)
+    
+    # 1.4 所有参数测试
+    all_params_test = create_normal_test(path, method, description, parameters, name)
+    all_params_test["name"] = f"{name}_所有参数测试"
+    all_params_test["description"] = "使用所有参数测试API"
+    
+    # 确保所有非必填参数也被添加
+    for param, param_type in optional_params:
+        param_name = param.get("name", "")
+        if param_name not in all_params_test["request"]["body"]:
+            gen = _RANDOM_VALUE_GENERATORS.get(param_type)
+            all_params_test["request"]["body"][param_name] = gen(param_name) if gen else f"default_value_for_{param_name}"
+    
+    add_test("等价类测试", all_params_test)
+    
+    # 1.5 不同数据类型测试
+    for param, data_type in data_type_params:
+        data_type_test = create_data_type_test(path, method, description, parameters, param, data_type, name, required_body)
+        add_test("等价类测试", data_type_test)
+    
+    # 2. 边界值测试（没有数值或字符串参数时跳过整个部分）
+    if boundary_params and cit:
+        logger.debug("生成 %s 的边界值组合测试...", api_name)
+        
+        # 有效边界值两两组合覆盖；Action的取值固定，不参与组合
+        cit_params = [(param, data_type) for param, data_type in boundary_params if param.get("name", "").lower() != "action"]
+        factors = [_VALID_BOUNDARIES[data_type] for _, data_type in cit_params]
+        for variant in pairwise_variants(factors):
+            targets = [(param, data_type, boundary_type) for (param, data_type), boundary_type in zip(cit_params, variant)]
+            combination_test = create_boundary_combination_test(path, method, description, parameters, targets, name, required_body)
+            add_test("边界值测试", combination_test)
+        
+        # 无效边界值预期请求失败，组合后无法区分是哪个参数导致的，仍然逐个单独测试
+        for param, data_type in boundary_params:
+            for boundary_type in _ERROR_BOUNDARIES[data_type]:
+                error_test = create_boundary_test(path, method, description, parameters, param, boundary_type, name, required_body)
+                add_test("边界值测试", error_test)
+    elif boundary_params:
+        logger.debug("生成 %s 的边界值测试...", api_name)
+        
+        for param, data_type in boundary_params:
+            if data_type == "number":
+                # 2.1 数值型边界测试
+                max_test = create_boundary_test(path, method, description, parameters, param, "max", name, required_body)
+                add_test("边界值测试", max_test)
+                
+                max_plus_one_test = create_boundary_test(path, method, description, parameters, param, "max_plus_one", name, required_body)
+                add_test("边界值测试", max_plus_one_test)
+                
+                min_test = create_boundary_test(path, method, description, parameters, param, "min", name, required_body)
+                add_test("边界值测试", min_test)
+                
+                min_minus_one_test = create_boundary_test(path, method, description, parameters, param, "min_minus_one", name, required_body)
+                add_test("边界值测试", min_minus_one_test)
+                
+                zero_test = create_boundary_test(path, method, description, parameters, param, "zero", name, required_body)
+                add_test("边界值测试", zero_test)
+                
+                negative_test = create_boundary_test(path, method, description, parameters, param, "negative", name, required_body)
+                add_test("边界值测试", negative_test)
+                
+                large_test = create_boundary_test(path, method, description, parameters, param, "large", name, required_body)
+                add_test("边界值测试", large_test)
+                
+            elif data_type == "string":
+                # 2.2 字符串边界测试
+                empty_test = create_boundary_test(path, method, description, parameters, param, "empty", name, required_body)
+                add_test("边界值测试", empty_test)
+                
+                long_test = create_boundary_test(path, method, description, parameters, param, "long", name, required_body)
+                add_test("边界值测试", long_test)
+                
+                special_test = create_boundary_test(path, method, description, parameters, param, "special", name, required_body)
+                add_test("边界值测试", special_test)
+                
+                spaces_test = create_boundary_test(path, method, description, parameters, param, "spaces", name, required_body)
+                add_test("边界值测试", spaces_test)
+                
+                emoji_test = create_boundary_test(path, method, description, parameters, param, "emoji", name, required_body)
+                add_test("边界值测试", emoji_test)
+                
+                multilingual_test = create_boundary_test(path, method, description, parameters, param, "multilingual", name, required_body)
+                add_test("边界值测试", multilingual_test)
+        
+    # 3. 异常测试
+    logger.debug("生成 %s 的异常测试...", api_name)
+    
+    # 3.1 缺失必填参数测试
+    for param in required_params:
+        missing_param_test = create_missing_param_test(path, method, description, parameters, param, name, required_body)
+        add_test("异常测试", missing_param_test)
+    
+    # 3.2 无效数据类型测试（对每个参数）
+    for param in invalid_type_params:
+        invalid_type_test = create_invalid_type_test(path, method, description, parameters, param, name, required_body)
+        add_test("异常测试", invalid_type_test)
+    
+    # 3.3 格式错误测试（针对特定格式如Email、URL等）
+    email_format_test = create_format_error_test(path, method, description, parameters, "email", name, required_body)
+    add_test("异常测试", email_format_test)
+    
+    url_format_test = create_format_error_test(path, method, description, parameters, "url", name, required_body)
+    add_test("异常测试", url_format_test)
+    
+    date_format_test = create_format_error_test(path, method, description, parameters, "date", name, required_body)
+    add_test("异常测试", date_format_test)
+    
+    json_format_test = create_format_error_test(path, method, description, parameters, "json", name, required_body)
+    add_test("异常测试", json_format_test)
+    
+    # 4. 特殊测试
+    logger.debug("生成 %s 的特殊测试...", api_name)
+    
+    # 4.1 幂等性测试（对于支持幂等性的API）
+    idempotent_test = create_idempotency_test(path, method, description, parameters, name)
+    add_test("特殊测试", idempotent_test)
+    
+    # 4.2 性能测试
+    performance_test = create_performance_test(path, method, description, parameters, name)
+    add_test("特殊测试", performance_test)
+    
+    # 4.3 安全测试
+    security_test = create_security_test(path, method, description, parameters, name)
+    add_test("特殊测试", security_test)
+    
+    # 4.4 文档验证测试（检查响应是否符合文档）
+    doc_validation_test = create_doc_validation_test(path, method, description, parameters, responses, name)
+    add_test("特殊测试", doc_validation_test)
+    
+    logger.info("为 API %s 生成了 %d 个测试用例", name, len(flat_test_cases))
+    
+    return endpoint_key, {
+        "endpoint": {
+            "path": path,
+            "method": method,
+            "description": description
+        },
+        "test_cases": flat_test_cases
+    }
+
+def _reseed_worker():
+    """进程池初始化：各工作进程重新设定随机种子并清空继承来的随机后缀池，避免不同进程生成相同的随机值"""
+    random.seed()
+    _SUFFIX_POOL.clear()
+
+def generate_post_testcases(api_file, output_file, base_url, cit=False):
     """
     生成POST测试用例
     
@@ -153,290 +619,100 @@ def generate_post_testcases(api_file, output_file, base_url):
         api_file: API描述文件路径（JSON、PDF或Markdown）
         output_file: 输出的测试用例文件路径
         base_url: API的基础URL
+        cit: 为True时，有效边界值按两两组合覆盖生成组合测试用例，而不是每个参数每种边界值各生成一个
     """
-    print(f"从 {api_file} 生成POST测试用例...")
-    
-    endpoints = []
-    
-    # 检查文件扩展名
-    _, ext = os.path.splitext(api_file)
-    
-    if ext.lower() == '.md':
-        # 处理Markdown文件
-        api_info = parse_markdown_api_doc(api_file)
-        if api_info and api_info["path"]:
-            endpoints = [{
-                "path": api_info["path"],
-                "method": "POST",
-                "name": api_info["name"],
-                "description": api_info["description"],
-                "parameters": api_info["parameters"],
-                "responses": api_info.get("responses", [])
-            }]
-    elif ext.lower() == '.json':
-        # 处理JSON文件
-        try:
-            with open(api_file, 'r', encoding='utf-8') as f:
-                api_data = json.load(f)
-                
-            if "endpoints" in api_data:
-                endpoints = api_data.get("endpoints", [])
-        except Exception as e:
-            print(f"读取JSON文件时出错: {str(e)}")
-    else:
-        # 不支持的文件类型，使用默认测试端点
-        print(f"不支持的文件类型: {ext}，使用默认测试端点")
-        endpoints = [{
-            "path": "/api/test",
-            "method": "POST",
-            "description": "Default test endpoint"
-        }]
+    logger.info("从 %s 生成POST测试用例...", api_file)
+    
+    # 按文件扩展名选择端点加载方式
+    ext = os.path.splitext(api_file)[1].lower()
+    endpoints = _FILE_HANDLERS.get(ext, _load_endpoints_default)(api_file)
     
     # 生成测试用例
     test_cases = {}
     
-    for endpoint in endpoints:
-        path = endpoint.get("path", "").strip()
-        method = "POST"  # 强制使用POST
-        api_name = endpoint.get("name", "")
-        description = endpoint.get("description", "")
-        parameters = endpoint.get("parameters", [])
-        responses = endpoint.get("responses", [])
-        endpoint_key = f"{method} {path}"
-        
-        # 提取名称（通常是路径的最后一段或API名称）
-        name = api_name if api_name else path.strip('/').split('/')[-1]
-        
-        # 创建一个有组织的测试用例集合，按类别分组
-        endpoint_test_cases = {
-            "等价类测试": [],
-            "边界值测试": [],
-            "异常测试": [],
-            "特殊测试": []
-        }
-        
-        # 1. 等价类测试
-        print(f"生成 {api_name} 的等价类测试...")
-        
-        # 1.1 正常请求测试（所有参数有效值）
-        normal_test = create_normal_test(path, method, description, parameters, name)
-        endpoint_test_cases["等价类测试"].append(normal_test)
-        
-        # 1.2 仅必填参数测试
-        required_only_test = create_required_only_test(path, method, description, parameters, name)
-        endpoint_test_cases["等价类测试"].append(required_only_test)
-        
-        # 1.3 部分选填参数测试
-        partial_optional_test = create_normal_test(path, method, description, parameters, name)
-        partial_optional_test["name"] = f"{name}_部分选填参数测试"
-        partial_optional_test["description"] = "测试部分选填参数"
-        endpoint_test_cases["等价类测试"].append(partial_optional_test)
-        
-        # 1.4 所有参数测试
-        all_params_test = create_normal_test(path, method, description, parameters, name)
-        all_params_test["name"] = f"{name}_所有参数测试"
-        all_params_test["description"] = "使用所有参数测试API"
-        
-        # 确保所有非必填参数也被添加
-        for param in parameters:
-            param_name = param.get("name", "")
-            param_type = param.get("type", "").lower()
-            required = param.get("required", False)
-            
-            if not required and param_name not in all_params_test["request"]["body"]:
-                if param_name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
-                    continue
-                    
-                if param_type == "string":
-                    all_params_test["request"]["body"][param_name] = f"test_{param_name}_{generate_random_string(5)}"
-                elif param_type in ["number", "integer", "int"]:
-                    all_params_test["request"]["body"][param_name] = random.randint(1, 100)
-                elif param_type in ["boolean", "bool"]:
-                    all_params_test["request"]["body"][param_name] = random.choice([True, False])
-                elif param_type == "array":
-                    all_params_test["request"]["body"][param_name] = [f"item_{i}" for i in range(1, 4)]
-                else:
-                    all_params_test["request"]["body"][param_name] = f"default_value_for_{param_name}"
-        
-        endpoint_test_cases["等价类测试"].append(all_params_test)
-        
-        # 1.5 不同数据类型测试
-        for param in parameters:
-            param_name = param.get("name", "")
-            param_type = param.get("type", "").lower()
-            if param_name not in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
-                if param_type in ["number", "integer", "int"]:
-                    number_type_test = create_data_type_test(path, method, description, parameters, param, "number", name)
-                    endpoint_test_cases["等价类测试"].append(number_type_test)
-                elif param_type == "string":
-                    string_type_test = create_data_type_test(path, method, description, parameters, param, "string", name)
-                    endpoint_test_cases["等价类测试"].append(string_type_test)
-                elif param_type in ["boolean", "bool"]:
-                    boolean_type_test = create_data_type_test(path, method, description, parameters, param, "boolean", name)
-                    endpoint_test_cases["等价类测试"].append(boolean_type_test)
-                elif param_type == "array":
-                    array_type_test = create_data_type_test(path, method, description, parameters, param, "array", name)
-                    endpoint_test_cases["等价类测试"].append(array_type_test)
-        
-        # 2. 边界值测试
-        print(f"生成 {api_name} 的边界值测试...")
-        
-        for param in parameters:
-            param_type = param.get("type", "").lower()
-            param_name = param.get("name", "")
-            
-            if param_name not in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
-                if param_type in ["number", "integer", "int"]:
-                    # 2.1 数值型边界测试
-                    max_test = create_boundary_test(path, method, description, parameters, param, "max", name)
-                    endpoint_test_cases["边界值测试"].append(max_test)
-                    
-                    max_plus_one_test = create_boundary_test(path, method, description, parameters, param, "max_plus_one", name)
-                    endpoint_test_cases["边界值测试"].append(max_plus_one_test)
-                    
-                    min_test = create_boundary_test(path, method, description, parameters, param, "min", name)
-                    endpoint_test_cases["边界值测试"].append(min_test)
-                    
-                    min_minus_one_test = create_boundary_test(path, method, description, parameters, param, "min_minus_one", name)
-                    endpoint_test_cases["边界值测试"].append(min_minus_one_test)
-                    
-                    zero_test = create_boundary_test(path, method, description, parameters, param, "zero", name)
-                    endpoint_test_cases["边界值测试"].append(zero_test)
-                    
-                    negative_test = create_boundary_test(path, method, description, parameters, param, "negative", name)
-                    endpoint_test_cases["边界值测试"].append(negative_test)
-                    
-                    large_test = create_boundary_test(path, method, description, parameters, param, "large", name)
-                    endpoint_test_cases["边界值测试"].append(large_test)
-                    
-                elif param_type == "string":
-                    # 2.2 字符串边界测试
-                    empty_test = create_boundary_test(path, method, description, parameters, param, "empty", name)
-                    endpoint_test_cases["边界值测试"].append(empty_test)
-                    
-                    long_test = create_boundary_test(path, method, description, parameters, param, "long", name)
-                    endpoint_test_cases["边界值测试"].append(long_test)
-                    
-                    special_test = create_boundary_test(path, method, description, parameters, param, "special", name)
-                    endpoint_test_cases["边界值测试"].append(special_test)
-                    
-                    spaces_test = create_boundary_test(path, method, description, parameters, param, "spaces", name)
-                    endpoint_test_cases["边界值测试"].append(spaces_test)
-                    
-                    emoji_test = create_boundary_test(path, method, description, parameters, param, "emoji", name)
-                    endpoint_test_cases["边界值测试"].append(emoji_test)
-                    
-                    multilingual_test = create_boundary_test(path, method, description, parameters, param, "multilingual", name)
-                    endpoint_test_cases["边界值测试"].append(multilingual_test)
-        
-        # 3. 异常测试
-        print(f"生成 {api_name} 的异常测试...")
-        
-        # 3.1 缺失必填参数测试
-        for param in parameters:
-            if param.get("required", False):
-                missing_param_test = create_missing_param_test(path, method, description, parameters, param, name)
-                endpoint_test_cases["异常测试"].append(missing_param_test)
-        
-        # 3.2 无效数据类型测试（对每个参数）
-        for param in parameters:
-            if param.get("name", "") not in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey", "Action"]:
-                invalid_type_test = create_invalid_type_test(path, method, description, parameters, param, name)
-                endpoint_test_cases["异常测试"].append(invalid_type_test)
-        
-        # 3.3 格式错误测试（针对特定格式如Email、URL等）
-        email_format_test = create_format_error_test(path, method, description, parameters, "email", name)
-        endpoint_test_cases["异常测试"].append(email_format_test)
-        
-        url_format_test = create_format_error_test(path, method, description, parameters, "url", name)
-        endpoint_test_cases["异常测试"].append(url_format_test)
-        
-        date_format_test = create_format_error_test(path, method, description, parameters, "date", name)
-        endpoint_test_cases["异常测试"].append(date_format_test)
-        
-        json_format_test = create_format_error_test(path, method, description, parameters, "json", name)
-        endpoint_test_cases["异常测试"].append(json_format_test)
-        
-        # 4. 特殊测试
-        print(f"生成 {api_name} 的特殊测试...")
-        
-        # 4.1 幂等性测试（对于支持幂等性的API）
-        idempotent_test = create_idempotency_test(path, method, description, parameters, name)
-        endpoint_test_cases["特殊测试"].append(idempotent_test)
-        
-        # 4.2 性能测试
-        performance_test = create_performance_test(path, method, description, parameters, name)
-        endpoint_test_cases["特殊测试"].append(performance_test)
-        
-        # 4.3 安全测试
-        security_test = create_security_test(path, method, description, parameters, name)
-        endpoint_test_cases["特殊测试"].append(security_test)
-        
-        # 4.4 文档验证测试（检查响应是否符合文档）
-        doc_validation_test = create_doc_validation_test(path, method, description, parameters, responses, name)
-        endpoint_test_cases["特殊测试"].append(doc_validation_test)
-        
-        # 将所有测试用例扁平化为列表
-        flat_test_cases = []
-        for category, tests in endpoint_test_cases.items():
-            for test in tests:
-                # 添加测试类别到测试用例
-                test["category"] = category
-                flat_test_cases.append(test)
-        
-        test_cases[endpoint_key] = {
-            "endpoint": {
-                "path": path,
-                "method": method,
-                "description": description
-            },
-            "test_cases": flat_test_cases
-        }
-        
-        print(f"为 API {name} 生成了 {len(flat_test_cases)} 个测试用例")
+    if len(endpoints) > 1:
+        # 各端点的测试用例互不依赖，多个端点时分发到多个进程并行生成
+        with ProcessPoolExecutor(initializer=_reseed_worker) as executor:
+            results = list(executor.map(_generate_endpoint_test_cases, endpoints, repeat(cit), chunksize=8))
+    else:
+        results = [_generate_endpoint_test_cases(endpoint, cit) for endpoint in endpoints]
+    
+    for endpoint_key, entry in results:
+        test_cases[endpoint_key] = entry
     
     # 保存到输出文件
     try:
-        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(test_cases, f, indent=2, ensure_ascii=False)
-        print(f"测试用例已保存到: {output_file}")
-        print(f"总共生成了 {sum(len(data['test_cases']) for data in test_cases.values())} 个测试用例")
+            dump_test_cases(test_cases, f)
+        logger.info("测试用例已保存到: %s", output_file)
+        logger.info("总共生成了 %d 个测试用例", sum(len(data['test_cases']) for data in test_cases.values()))
     except Exception as e:
-        print(f"保存测试用例时出错: {str(e)}")
+        logger.error("保存测试用例时出错: %s", e)
     
     return test_cases
 
-def create_normal_test(path, method, description, parameters, api_name=""):
-    """创建正常路径测试用例"""
-    test_case = {
-        "name": f"{api_name}_正常路径测试" if api_name else "正常路径测试",
-        "description": f"使用所有必填参数和常见可选参数测试API的正常功能",
+def _param_category(param):
+    """
+    返回参数类型所属的类别（number/string/boolean/array），未知类型返回None
+    
+    生成测试用例前已对每个参数计算一次并存入"_ntype"字段，直接调用构建函数时才现算
+    """
+    if "_ntype" in param:
+        return param["_ntype"]
+    return _DATA_TYPE_CATEGORIES.get(param.get("type", "").lower())
+
+def _new_test_case(name, description, path, method, body, expected):
+    """按统一结构组装测试用例，请求头使用共享的_JSON_HEADERS"""
+    return {
+        "name": name,
+        "description": description,
         "request": {
             "path": path,
             "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
+            "headers": _JSON_HEADERS,
+            "body": body
         },
-        "expected": {
-            "status": 200,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                "RetCode": 0
-            }
-        }
+        "expected": expected
     }
+
+def _build_required_body(parameters, api_name):
+    """
+    生成除通用参数外所有必填参数的取值
+    
+    仅使用必填参数的各类测试用例都在通用参数和这份取值的基础上构建请求体。
+    每个API只计算一次再传给各构建函数；取值含随机部分，因此不跨API缓存，
+    否则参数相同的API会得到完全相同的随机值
+
+    Args:
+        parameters: 参数列表
+        api_name: API名称，用作Action参数的值
+        
+    Returns:
+        参数名到取值的字典
+    """
+    required_body = {}
+    for param in parameters:
+        name = param.get("name", "")
+        if name in _COMMON_PARAMS or not param.get("required", False):
+            continue
+        
+        if name.lower() == "action":
+            required_body[name] = api_name
+        else:
+            gen = _REQUIRED_VALUE_GENERATORS.get(param.get("type", "string"))
+            required_body[name] = gen(name) if gen else f"default_value_for_{name}"
+    return required_body
+
+def create_normal_test(path, method, description, parameters, api_name=""):
+    """创建正常路径测试用例"""
+    # 添加通用必填参数；预期结果会被幂等性、性能等测试修改，每次新建
+    test_case = _new_test_case(
+        f"{api_name}_正常路径测试" if api_name else "正常路径测试",
+        f"使用所有必填参数和常见可选参数测试API的正常功能",
+        path, method, _BASE_BODY.copy(),
+        {"status": 200, "headers": _JSON_HEADERS, "body": {"RetCode": 0}}
+    )
+    body = test_case["request"]["body"]
     
     # 添加所有必填参数和部分可选参数
     for param in parameters:
@@ -445,76 +721,29 @@ def create_normal_test(path, method, description, parameters, api_name=""):
         required = param.get("required", False)
         
         # 跳过已经添加的通用参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
+        if name in _COMMON_PARAMS:
             continue
             
         if required or random.random() > 0.5:  # 随机选择一些可选参数
             if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}_{generate_random_string(5)}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = random.randint(1, 100)
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = random.choice([True, False])
-            elif param_type == "array":
-                test_case["request"]["body"][name] = [f"item_{i}" for i in range(1, 4)]
+                body[name] = api_name
             else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+                gen = _RANDOM_VALUE_GENERATORS.get(param_type)
+                body[name] = gen(name) if gen else f"default_value_for_{name}"
     
     return test_case
 
-def create_required_only_test(path, method, description, parameters, api_name=""):
+def create_required_only_test(path, method, description, parameters, api_name="", required_body=None):
     """仅使用必填参数的测试用例"""
-    test_case = {
-        "name": f"{api_name}_仅必填参数测试" if api_name else "仅必填参数测试",
-        "description": "仅使用必填参数测试API",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 200,
-            "body": {
-                "RetCode": 0
-            }
-        }
-    }
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
     
-    # 仅添加必填参数
-    for param in parameters:
-        name = param.get("name", "")
-        param_type = param.get("type", "string")
-        required = param.get("required", False)
-        
-        # 跳过已经添加的通用参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
-            continue
-            
-        if required:
-            if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
-            elif param_type == "array":
-                test_case["request"]["body"][name] = ["item_1"]
-            else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_仅必填参数测试" if api_name else "仅必填参数测试",
+        "仅使用必填参数测试API",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_OK
+    )
     
     return test_case
 
@@ -530,17 +759,17 @@ def create_partial_optional_test(path, method, description, parameters, api_name
         required = param.get("required", False)
         
         if required:
-            if param_name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
+            if param_name in _COMMON_PARAMS:
                 request_data[param_name] = f"{{{{{param_name}}}}}"
             else:
                 if param_type == "string":
-                    request_data[param_name] = f"test_{param_name}_{generate_random_string(5)}"
+                    request_data[param_name] = f"test_{param_name}_{next_random_suffix()}"
                 elif param_type == "integer" or param_type == "number" or param_type == "int":
                     request_data[param_name] = random.randint(1, 100)
                 elif param_type == "boolean" or param_type == "bool":
-                    request_data[param_name] = random.choice([True, False])
+                    request_data[param_name] = bool(random.getrandbits(1))
                 elif param_type == "array":
-                    request_data[param_name] = [f"item_{generate_random_string(3)}" for _ in range(2)]
+                    request_data[param_name] = generate_random_items(2, 3)
     
     # 添加部分选填参数（随机选择一半）
     selected_optional = random.sample(optional_params, max(1, len(optional_params) // 2)) if optional_params else []
@@ -549,17 +778,17 @@ def create_partial_optional_test(path, method, description, parameters, api_name
         param_name = param.get("name", "")
         param_type = param.get("type", "string")
         
-        if param_name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
+        if param_name in _COMMON_PARAMS:
             request_data[param_name] = f"{{{{{param_name}}}}}"
         else:
             if param_type == "string":
-                request_data[param_name] = f"test_{param_name}_{generate_random_string(5)}"
+                request_data[param_name] = f"test_{param_name}_{next_random_suffix()}"
             elif param_type == "integer" or param_type == "number" or param_type == "int":
                 request_data[param_name] = random.randint(1, 100)
             elif param_type == "boolean" or param_type == "bool":
-                request_data[param_name] = random.choice([True, False])
+                request_data[param_name] = bool(random.getrandbits(1))
             elif param_type == "array":
-                request_data[param_name] = [f"item_{generate_random_string(3)}" for _ in range(2)]
+                request_data[param_name] = generate_random_items(2, 3)
     
     # 添加Action参数（UCloud API 要求）
     action = path.strip('/').split('/')[-1]
@@ -570,9 +799,7 @@ def create_partial_optional_test(path, method, description, parameters, api_name
         "description": f"测试提供必填参数和部分选填参数的情况",
         "method": method,
         "path": path,
-        "headers": {
-            "Content-Type": "application/json"
-        },
+        "headers": _JSON_HEADERS,
         "request_data": request_data,
         "expected_status": 200,
         "validations": [
@@ -597,17 +824,17 @@ def create_all_params_test(path, method, description, parameters, api_name=""):
         param_name = param.get("name", "")
         param_type = param.get("type", "string")
         
-        if param_name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
+        if param_name in _COMMON_PARAMS:
             request_data[param_name] = f"{{{{{param_name}}}}}"
         else:
             if param_type == "string":
-                request_data[param_name] = f"test_{param_name}_{generate_random_string(5)}"
+                request_data[param_name] = f"test_{param_name}_{next_random_suffix()}"
             elif param_type == "integer" or param_type == "number" or param_type == "int":
                 request_data[param_name] = random.randint(1, 100)
             elif param_type == "boolean" or param_type == "bool":
-                request_data[param_name] = random.choice([True, False])
+                request_data[param_name] = bool(random.getrandbits(1))
             elif param_type == "array":
-                request_data[param_name] = [f"item_{generate_random_string(3)}" for _ in range(2)]
+                request_data[param_name] = generate_random_items(2, 3)
     
     # 添加Action参数（UCloud API 要求）
     action = path.strip('/').split('/')[-1]
@@ -618,9 +845,7 @@ def create_all_params_test(path, method, description, parameters, api_name=""):
         "description": f"测试提供所有参数（必填和选填）的情况",
         "method": method,
         "path": path,
-        "headers": {
-            "Content-Type": "application/json"
-        },
+        "headers": _JSON_HEADERS,
         "request_data": request_data,
         "expected_status": 200,
         "validations": [
@@ -636,387 +861,172 @@ def create_all_params_test(path, method, description, parameters, api_name=""):
         ]
     }
 
-def create_data_type_test(path, method, description, parameters, target_param, data_type, api_name=""):
+def create_data_type_test(path, method, description, parameters, target_param, data_type, api_name="", required_body=None):
     """创建针对特定数据类型参数的测试用例"""
-    test_case = {
-        "name": f"{api_name}_{target_param.get('name', '')}_{data_type}_类型测试",
-        "description": f"测试{data_type}类型参数 {target_param.get('name', '')} 的处理",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 200,
-            "body": {
-                "RetCode": 0
-            }
-        }
-    }
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
+    target_name = target_param.get("name", "")
     
-    # 添加必填参数
-    for param in parameters:
-        name = param.get("name", "")
-        param_type = param.get("type", "string")
-        required = param.get("required", False)
-        
-        # 跳过已经添加的通用参数和目标参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"] or name == target_param.get("name", ""):
-            continue
-            
-        if required:
-            if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
-            elif param_type == "array":
-                test_case["request"]["body"][name] = ["item_1"]
-            else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_{target_name}_{data_type}_类型测试",
+        f"测试{data_type}类型参数 {target_name} 的处理",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_OK
+    )
+    body = test_case["request"]["body"]
+    
+    # 目标参数由下面单独处理
+    body.pop(target_name, None)
     
     # 特别处理目标参数
-    target_name = target_param.get("name", "")
     
     # 根据测试的数据类型，设置相应的值
     if data_type == "number":
-        test_case["request"]["body"][target_name] = 42
+        body[target_name] = 42
     elif data_type == "string":
-        test_case["request"]["body"][target_name] = f"测试字符串Value_123"
+        body[target_name] = f"测试字符串Value_123"
     elif data_type == "boolean":
-        test_case["request"]["body"][target_name] = True
+        body[target_name] = True
     elif data_type == "array":
-        test_case["request"]["body"][target_name] = ["item1", "item2", "item3"]
+        body[target_name] = ["item1", "item2", "item3"]
     elif data_type == "object":
-        test_case["request"]["body"][target_name] = {"key1": "value1", "key2": "value2"}
+        body[target_name] = {"key1": "value1", "key2": "value2"}
     
     # 如果是Action参数，确保值为API名称
     if target_name.lower() == "action" and api_name:
-        test_case["request"]["body"][target_name] = api_name
+        body[target_name] = api_name
     
     return test_case
 
-def create_boundary_test(path, method, description, parameters, target_param, boundary_type, api_name=""):
+def create_boundary_test(path, method, description, parameters, target_param, boundary_type, api_name="", required_body=None):
     """创建边界值测试用例"""
-    test_case = {
-        "name": f"{api_name}_{target_param.get('name', '')}_{boundary_type}_边界值测试",
-        "description": f"测试参数 {target_param.get('name', '')} 的{boundary_type}边界值",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 200,
-            "body": {
-                "RetCode": 0
-            }
-        }
-    }
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
+    target_name = target_param.get("name", "")
     
-    # 添加必填参数
-    for param in parameters:
-        name = param.get("name", "")
-        param_type = param.get("type", "string")
-        required = param.get("required", False)
-        
-        # 跳过已经添加的通用参数和目标参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"] or name == target_param.get("name", ""):
-            continue
-            
-        if required:
-            if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
-            elif param_type == "array":
-                test_case["request"]["body"][name] = ["item_1"]
-            else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_{target_name}_{boundary_type}_边界值测试",
+        f"测试参数 {target_name} 的{boundary_type}边界值",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_OK
+    )
+    body = test_case["request"]["body"]
     
-    # 特别处理目标参数
-    target_name = target_param.get("name", "")
-    target_type = target_param.get("type", "").lower()
+    # 目标参数由下面单独处理
+    body.pop(target_name, None)
     
     # 根据边界类型和参数类型，设置相应的值
-    if target_type in ["number", "integer", "int"]:
-        if boundary_type == "max":
-            test_case["request"]["body"][target_name] = 2147483647  # INT_MAX
-            test_case["description"] = f"测试参数 {target_name} 的最大值(INT_MAX)"
-        elif boundary_type == "max_plus_one":
-            test_case["request"]["body"][target_name] = 2147483648  # INT_MAX + 1
-            test_case["description"] = f"测试参数 {target_name} 的最大值+1(INT_MAX+1)"
-            test_case["expected"]["status"] = 400
-            test_case["expected"]["body"]["RetCode"] = {"$ne": 0}
-        elif boundary_type == "min":
-            test_case["request"]["body"][target_name] = -2147483648  # INT_MIN
-            test_case["description"] = f"测试参数 {target_name} 的最小值(INT_MIN)"
-        elif boundary_type == "min_minus_one":
-            test_case["request"]["body"][target_name] = -2147483649  # INT_MIN - 1
-            test_case["description"] = f"测试参数 {target_name} 的最小值-1(INT_MIN-1)"
-            test_case["expected"]["status"] = 400
-            test_case["expected"]["body"]["RetCode"] = {"$ne": 0}
-        elif boundary_type == "zero":
-            test_case["request"]["body"][target_name] = 0
-            test_case["description"] = f"测试参数 {target_name} 的零值(0)"
-        elif boundary_type == "negative":
-            test_case["request"]["body"][target_name] = -1
-            test_case["description"] = f"测试参数 {target_name} 的负值(-1)"
-        elif boundary_type == "large":
-            test_case["request"]["body"][target_name] = 9999999999
-            test_case["description"] = f"测试参数 {target_name} 的超大值(9999999999)"
-            test_case["expected"]["status"] = 400
-            test_case["expected"]["body"]["RetCode"] = {"$ne": 0}
-    elif target_type == "string":
-        if boundary_type == "empty":
-            test_case["request"]["body"][target_name] = ""
-            test_case["description"] = f"测试参数 {target_name} 的空字符串"
-        elif boundary_type == "long":
-            test_case["request"]["body"][target_name] = "a" * 1000
-            test_case["description"] = f"测试参数 {target_name} 的超长字符串(1000字符)"
-            test_case["expected"]["status"] = 400
-            test_case["expected"]["body"]["RetCode"] = {"$ne": 0}
-        elif boundary_type == "special":
-            test_case["request"]["body"][target_name] = "!@#$%^&*()_+-=[]{}|;':\",./<>?\\"
-            test_case["description"] = f"测试参数 {target_name} 的特殊字符"
-        elif boundary_type == "spaces":
-            test_case["request"]["body"][target_name] = "   空格前后   "
-            test_case["description"] = f"测试参数 {target_name} 的空格前后"
-        elif boundary_type == "emoji":
-            test_case["request"]["body"][target_name] = "测试Emoji😀👍🎉"
-            test_case["description"] = f"测试参数 {target_name} 的Emoji字符"
-        elif boundary_type == "multilingual":
-            test_case["request"]["body"][target_name] = "English中文日本語한국어"
-            test_case["description"] = f"测试参数 {target_name} 的多语言字符"
+    spec = _BOUNDARY_SPECS.get((_param_category(target_param), boundary_type))
+    if spec:
+        value, suffix, is_error = spec
+        body[target_name] = value
+        test_case["description"] = f"测试参数 {target_name} 的{suffix}"
+        if is_error:
+            test_case["expected"] = _EXPECTED_ERROR
     
     # 如果是Action参数，确保值为API名称
     if target_name.lower() == "action" and api_name:
-        test_case["request"]["body"][target_name] = api_name
+        body[target_name] = api_name
     
     return test_case
 
-def create_missing_param_test(path, method, description, parameters, target_param, api_name=""):
-    """创建缺失必需参数的测试用例"""
-    test_case = {
-        "name": f"{api_name}_{target_param.get('name', '')}_缺失测试",
-        "description": f"测试缺少必需参数 {target_param.get('name', '')} 的情况",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 400,
-            "body": {
-                "RetCode": {"$ne": 0}
-            }
-        }
-    }
+def create_boundary_combination_test(path, method, description, parameters, targets, api_name="", required_body=None):
+    """
+    创建同时覆盖多个参数有效边界值的组合测试用例
+    
+    Args:
+        targets: (参数, 数据类型, 边界类型)列表，数据类型为"number"或"string"
+    """
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
+    
+    combination = ", ".join(f"{param.get('name', '')}={boundary_type}" for param, _, boundary_type in targets)
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_边界值组合测试_{combination}",
+        f"同时测试多个参数的边界值: {combination}",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_OK
+    )
+    body = test_case["request"]["body"]
+    
+    for param, data_type, boundary_type in targets:
+        target_name = param.get("name", "")
+        body.pop(target_name, None)
+        body[target_name] = _BOUNDARY_SPECS[(data_type, boundary_type)][0]
     
+    return test_case
+
+def create_missing_param_test(path, method, description, parameters, target_param, api_name="", required_body=None):
+    """创建缺失必需参数的测试用例"""
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
     target_name = target_param.get("name", "")
     
-    # 如果目标参数是通用参数之一，从请求中移除它
-    if target_name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
-        del test_case["request"]["body"][target_name]
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_{target_name}_缺失测试",
+        f"测试缺少必需参数 {target_name} 的情况",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_ERROR
+    )
+    body = test_case["request"]["body"]
     
-    # 添加除目标参数外的所有必填参数
-    for param in parameters:
-        name = param.get("name", "")
-        param_type = param.get("type", "string")
-        required = param.get("required", False)
-        
-        # 跳过已经添加的通用参数和目标参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"] or name == target_name:
-            continue
-            
-        if required:
-            if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
-            elif param_type == "array":
-                test_case["request"]["body"][name] = ["item_1"]
-            else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+    # 从请求中移除目标参数（通用参数或其他必填参数）
+    body.pop(target_name, None)
     
     return test_case
 
-def create_invalid_type_test(path, method, description, parameters, target_param, api_name=""):
+def create_invalid_type_test(path, method, description, parameters, target_param, api_name="", required_body=None):
     """创建参数类型错误的测试用例"""
-    test_case = {
-        "name": f"{api_name}_{target_param.get('name', '')}_类型错误测试",
-        "description": f"测试参数 {target_param.get('name', '')} 类型错误的情况",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 400,
-            "body": {
-                "RetCode": {"$ne": 0}
-            }
-        }
-    }
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
+    target_name = target_param.get("name", "")
     
-    # 添加所有必填参数
-    for param in parameters:
-        name = param.get("name", "")
-        param_type = param.get("type", "string")
-        required = param.get("required", False)
-        
-        # 跳过已经添加的通用参数和目标参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"] or name == target_param.get("name", ""):
-            continue
-            
-        if required:
-            if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
-            elif param_type == "array":
-                test_case["request"]["body"][name] = ["item_1"]
-            else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_{target_name}_类型错误测试",
+        f"测试参数 {target_name} 类型错误的情况",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_ERROR
+    )
+    body = test_case["request"]["body"]
     
-    # 特别处理目标参数，设置错误的类型
-    target_name = target_param.get("name", "")
-    target_type = target_param.get("type", "").lower()
-    
-    # 故意设置错误的类型
-    if target_type == "string":
-        test_case["request"]["body"][target_name] = 12345
-    elif target_type in ["number", "integer", "int"]:
-        test_case["request"]["body"][target_name] = "这不是数字"
-    elif target_type in ["boolean", "bool"]:
-        test_case["request"]["body"][target_name] = "不是布尔值"
-    elif target_type == "array":
-        test_case["request"]["body"][target_name] = "不是数组"
+    # 目标参数由下面单独处理
+    body.pop(target_name, None)
+    
+    # 特别处理目标参数，故意设置错误的类型
+    target_type = _param_category(target_param)
+    if target_type in _INVALID_TYPE_VALUES:
+        body[target_name] = _INVALID_TYPE_VALUES[target_type]
     
     # 如果目标参数是Action，我们不应该改变它
     if target_name.lower() == "action" and api_name:
-        test_case["request"]["body"][target_name] = api_name
+        body[target_name] = api_name
         # 尝试使用其他方式测试Action参数的错误类型
-        test_case["request"]["body"]["InvalidActionParam"] = "InvalidActionValue"
+        body["InvalidActionParam"] = "InvalidActionValue"
     
     return test_case
 
-def create_format_error_test(path, method, description, parameters, format_type, api_name=""):
+def create_format_error_test(path, method, description, parameters, format_type, api_name="", required_body=None):
     """创建参数格式错误的测试用例"""
-    test_case = {
-        "name": f"{api_name}_{format_type}_格式错误测试",
-        "description": f"测试{format_type}格式参数错误的情况",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 400,
-            "body": {
-                "RetCode": {"$ne": 0}
-            }
-        }
-    }
+    if required_body is None:
+        required_body = _build_required_body(parameters, api_name)
     
-    # 添加必填参数
-    for param in parameters:
-        name = param.get("name", "")
-        param_type = param.get("type", "string")
-        required = param.get("required", False)
-        
-        # 跳过已经添加的通用参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
-            continue
-            
-        if required:
-            if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
-            elif param_type == "string":
-                test_case["request"]["body"][name] = f"test_{name}"
-            elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
-            elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
-            elif param_type == "array":
-                test_case["request"]["body"][name] = ["item_1"]
-            else:
-                test_case["request"]["body"][name] = f"default_value_for_{name}"
+    # 通用参数加上所有必填参数
+    test_case = _new_test_case(
+        f"{api_name}_{format_type}_格式错误测试",
+        f"测试{format_type}格式参数错误的情况",
+        path, method, {**_BASE_BODY, **required_body}, _EXPECTED_ERROR
+    )
+    body = test_case["request"]["body"]
     
     # 根据格式类型，插入一个格式错误的参数
     if format_type == "email":
-        test_case["request"]["body"]["Email"] = "无效的邮箱格式"
+        body["Email"] = "无效的邮箱格式"
     elif format_type == "url":
-        test_case["request"]["body"]["URL"] = "无效的URL格式"
+        body["URL"] = "无效的URL格式"
     elif format_type == "date":
-        test_case["request"]["body"]["StartTime"] = "无效的日期格式"
+        body["StartTime"] = "无效的日期格式"
     elif format_type == "json":
-        test_case["request"]["body"]["ConfigJson"] = "{ 这不是有效的JSON }"
+        body["ConfigJson"] = "{ 这不是有效的JSON }"
     
     return test_case
 
@@ -1068,31 +1078,13 @@ def create_doc_validation_test(path, method, description, parameters, responses,
 
 def create_security_test(path, method, description, parameters, api_name=""):
     """创建安全测试用例"""
-    test_case = {
-        "name": f"{api_name}_安全测试" if api_name else "安全测试",
-        "description": "测试API对于SQL注入和XSS攻击的防御能力",
-        "request": {
-            "path": path,
-            "method": method,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                # 添加通用必填参数
-                "Region": "{{Region}}",
-                "Zone": "{{Zone}}",
-                "ProjectId": "{{ProjectId}}",
-                "PublicKey": "{{PublicKey}}",
-                "PrivateKey": "{{PrivateKey}}"
-            }
-        },
-        "expected": {
-            "status": 200,
-            "body": {
-                "RetCode": {"$ne": 0}  # 期望非0错误码
-            }
-        }
-    }
+    # 添加通用必填参数
+    test_case = _new_test_case(
+        f"{api_name}_安全测试" if api_name else "安全测试",
+        "测试API对于SQL注入和XSS攻击的防御能力",
+        path, method, _BASE_BODY.copy(), _EXPECTED_REJECTED
+    )  # 期望非0错误码
+    body = test_case["request"]["body"]
     
     # 添加必填参数
     for param in parameters:
@@ -1101,22 +1093,22 @@ def create_security_test(path, method, description, parameters, api_name=""):
         required = param.get("required", False)
         
         # 跳过已经添加的通用参数
-        if name in ["Region", "Zone", "ProjectId", "PublicKey", "PrivateKey"]:
+        if name in _COMMON_PARAMS:
             continue
             
         if required:
             if name.lower() == "action":
-                test_case["request"]["body"][name] = api_name
+                body[name] = api_name
             elif param_type == "string":
-                test_case["request"]["body"][name] = "' OR 1=1; -- <script>alert('XSS')</script>"
+                body[name] = _INJECTION
             elif param_type == "number" or param_type == "integer" or param_type == "int":
-                test_case["request"]["body"][name] = 1
+                body[name] = 1
             elif param_type == "boolean" or param_type == "bool":
-                test_case["request"]["body"][name] = True
+                body[name] = True
             elif param_type == "array":
-                test_case["request"]["body"][name] = ["' OR 1=1; --", "<script>alert('XSS')</script>"]
+                body[name] = list(_INJECTION_ARRAY)
             else:
-                test_case["request"]["body"][name] = "' OR 1=1; -- <script>alert('XSS')</script>"
+                body[name] = _INJECTION
     
     return test_case
 
@@ -1125,10 +1117,14 @@ def main():
     parser.add_argument("-f", "--file", required=True, help="API描述文件路径")
     parser.add_argument("-o", "--output", default="reports/test_cases.json", help="输出文件路径")
     parser.add_argument("-u", "--url", default="https://api.ucloud.cn", help="API基础URL")
+    parser.add_argument("-c", "--cit", action="store_true", help="有效边界值按两两组合覆盖生成组合测试用例")
 
     args = parser.parse_args()
     
-    generate_post_testcases(args.file, args.output, args.url)
+    # 启动时一次性创建输出目录
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    
+    generate_post_testcases(args.file, args.output, args.url, cit=args.cit)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,29 +1,153 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import os
 import sys
 import json
 import argparse
+import functools
+import hashlib
 import random
 import string
 import re
 import copy
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 
 # Add project root to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
-from src.models.test_case import TestCase, TestCaseType, TestCaseCollection, Validation, ValidationType
-from src.models.api_schema import APISchema, Endpoint, Parameter, RequestBody
+from src.utils.json_utils import atomic_open, dumps_pretty
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# The model classes are imported where they are instantiated, so the CLI can
+# parse its arguments (and answer --help) without loading them
+if TYPE_CHECKING:
+    from src.models.test_case import TestCase, TestCaseCollection, Validation
+    from src.models.api_schema import Endpoint, Parameter
+
+# Patterns used by parse_markdown_api_doc, compiled once at import time
+_API_NAME_H1 = re.compile(r'#\s+(.+)-(\w+)')
+_API_NAME_H2 = re.compile(r'##\s+(.+)-(\w+)')
+_API_NAME_ALT = re.compile(r'#\s+([\w\s]+)\n')
+_PARAM_BLOCK = re.compile(r'```\s*([A-Za-z0-9_]+)\s+([a-z]+)\s+(.*?)(?=```)', re.DOTALL)
+_REQUIRED_BLOCK = re.compile(r'```\s*(Yes|No)\s*```', re.DOTALL)
+_PARAM_DIRECT = re.compile(r'```\s*([A-Za-z0-9_]+)\s+([a-z]+).*?```.*?```\s*(Yes|No)\s*```', re.DOTALL)
+
+# Header cells that are not parameters. Kept separate per format: a table may
+# well contain a real parameter called "Type" or "Description"
+_TABLE_HEADER_NAMES = frozenset({"Parameter name", "---"})
+_BLOCK_HEADER_NAMES = frozenset({"Parametername", "Type", "Description", "Required"})
+
+
+def _find_section(content: str, marker: str, terminator: str) -> Optional[str]:
+    """Return the text between the first marker and the next terminator.
+    
+    Equivalent to ``re.search(marker + '(.*?)(?:' + terminator + '|$)', content, re.DOTALL)``
+    but done with two ``str.find`` calls instead of a backtracking scan.
+    
+    Returns:
+        The section text, or None if the marker does not occur in content
+    """
+    start = content.find(marker)
+    if start == -1:
+        return None
+    start += len(marker)
+    end = content.find(terminator, start)
+    if end == -1:
+        # Without MULTILINE, $ first matches before a trailing newline
+        end = len(content) - 1 if content.endswith('\n') else len(content)
+    return content[start:end]
+
+
+def _table_rows(params_content: str) -> List[tuple]:
+    """Collect 4-cell table rows line by line.
+    
+    Produces the same tuples as ``re.findall(r'\\|(.*?)\\|(.*?)\\|(.*?)\\|(.*?)\\|', params_content)``:
+    every five consecutive pipes on a line form one row and the cells are the text between them.
+    """
+    rows = []
+    for line in params_content.split('\n'):
+        if '|' not in line:
+            continue
+        parts = line.split('|')
+        for first in range(1, len(parts) - 4, 5):
+            rows.append(tuple(parts[first:first + 4]))
+    return rows
+
+
+def _read_markdown(md_file_path: str) -> str:
+    """Read a UTF-8 text file with the same universal-newline handling as text mode.
+    
+    Reading bytes and decoding them in one call, then translating line endings only when
+    a carriage return is present, is several times faster than a text-mode read().
+    """
+    with open(md_file_path, 'rb') as f:
+        content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+# Default directory of the on-disk parse cache; bump the version when the parse result changes shape
+_PARSE_CACHE_DIR = os.path.join(project_root, ".cache", "md_parse")
+_PARSE_CACHE_VERSION = 2
+
+
+def parse_markdown_api_doc(md_file_path: str, cache_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Parse a Markdown format API document, optionally through an on-disk cache
+    
+    With cache_dir set, results are stored there as one JSON entry per document (named
+    after its absolute path) together with the file's modification time and size, so
+    re-runs over unchanged documents skip parsing. A changed document overwrites its
+    entry. Failed parses are not cached.
+    
+    Args:
+        md_file_path: Path to the Markdown file
+        cache_dir: Cache directory, or None to always parse
+        
+    Returns:
+        Dictionary with parsed API information including path, description, and parameters
+    """
+    if cache_dir is None:
+        return _parse_markdown_file(md_file_path)
+    
+    try:
+        stat = os.stat(md_file_path)
+    except OSError:
+        # Let the parser report the unreadable file
+        return _parse_markdown_file(md_file_path)
+    
+    abs_path = os.path.abspath(md_file_path)
+    stamp = {"path": abs_path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "version": _PARSE_CACHE_VERSION}
+    cache_file = Path(cache_dir) / f"{hashlib.sha1(abs_path.encode('utf-8')).hexdigest()}.json"
+    try:
+        entry = json.loads(cache_file.read_text(encoding='utf-8'))
+        if all(entry.get(field) == value for field, value in stamp.items()):
+            return entry["api_info"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    api_info = _parse_markdown_file(md_file_path)
+    if api_info is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_open(str(cache_file)) as f:
+                f.write(json.dumps(dict(stamp, api_info=api_info), ensure_ascii=False))
+        except OSError as e:
+            logger.warning("Could not write parse cache %s: %s", cache_file, e)
+    return api_info
+
 
-def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
+def _parse_markdown_file(md_file_path: str) -> Optional[Dict[str, Any]]:
     """
     Parse a Markdown format API document, extracting API info and parameters
     
@@ -34,16 +158,15 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
         Dictionary with parsed API information including path, description, and parameters
     """
     try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_markdown(md_file_path)
         
         # Extract API name and description - 更新正则表达式以匹配UCloud格式的API标题
         # 尝试匹配UCloud格式: "# 获取云数据库信息-DescribeUDBInstance"
-        api_name_match = re.search(r'#\s+(.+)-(\w+)', content)
+        api_name_match = _API_NAME_H1.search(content)
         
         # 如果找不到，尝试原来的格式
         if not api_name_match:
-            api_name_match = re.search(r'##\s+(.+)-(\w+)', content)
+            api_name_match = _API_NAME_H2.search(content)
         
         api_description = ""
         api_path = ""
@@ -52,19 +175,21 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
             api_description = api_name_match.group(1).strip()
             api_name = api_name_match.group(2).strip()
             api_path = f"/{api_name}"
-            logger.info(f"Found API: {api_path}, Description: {api_description}")
+            logger.info("Found API: %s, Description: %s", api_path, api_description)
         else:
             # 尝试其他可能的格式
-            api_name_match = re.search(r'#\s+([\w\s]+)\n', content)
+            api_name_match = _API_NAME_ALT.search(content)
             if api_name_match:
                 full_name = api_name_match.group(1).strip()
                 # 尝试提取API名称
-                name_parts = full_name.split()
-                if len(name_parts) > 0:
+                # 最后一个词是API名称，只需从右侧切分一次
+                name_parts = full_name.rsplit(None, 1)
+                if name_parts:
                     api_name = name_parts[-1]
-                    api_description = " ".join(name_parts[:-1])
+                    # 标题可能跨行，描述中的连续空白仍压缩为单个空格
+                    api_description = " ".join(name_parts[0].split()) if len(name_parts) == 2 else ""
                     api_path = f"/{api_name}"
-                    logger.info(f"Found API using alternative match: {api_path}, Description: {api_description}")
+                    logger.info("Found API using alternative match: %s, Description: %s", api_path, api_description)
                 else:
                     logger.warning("Could not extract API name and path from Markdown file")
                     return None
@@ -73,16 +198,16 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
                 return None
         
         # Find parameters section - UCloud通常使用"# Request Parameters"
-        request_params_section = re.search(r'# Request Parameters(.*?)(?:# |$)', content, re.DOTALL)
+        request_params_section = _find_section(content, '# Request Parameters', '# ')
         
         # 如果找不到，尝试原来的格式
-        if not request_params_section:
-            request_params_section = re.search(r'## RequestParameters(.*?)(?:## |$)', content, re.DOTALL)
+        if request_params_section is None:
+            request_params_section = _find_section(content, '## RequestParameters', '## ')
             
         parameters = []
         
-        if request_params_section:
-            params_content = request_params_section.group(1)
+        if request_params_section is not None:
+            params_content = request_params_section
             
             # Adapt for UCloud table format
             # Look for a markdown table format like:
@@ -91,7 +216,7 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
             # |Region|string|地域...|**Yes**|
             
             # 提取表格行
-            table_rows = re.findall(r'\|(.*?)\|(.*?)\|(.*?)\|(.*?)\|', params_content)
+            table_rows = _table_rows(params_content)
             
             if table_rows and len(table_rows) > 2:  # 跳过标题行和分隔行
                 # 跳过头部的2行 (标题和分隔符)
@@ -105,26 +230,26 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
                         required = "yes" in row[3].lower() and "**" in row[3]
                         
                         # 忽略表头行
-                        if param_name not in ["Parameter name", "---"]:
+                        if param_name not in _TABLE_HEADER_NAMES:
                             parameters.append({
                                 "name": param_name,
                                 "type": param_type,
                                 "description": description,
                                 "required": required
                             })
-                logger.info(f"Extracted {len(parameters)} parameters from table format")
+                logger.info("Extracted %d parameters from table format", len(parameters))
             
             # 如果没有找到参数或参数为空，尝试其他方式提取
             if not parameters:
                 logger.warning("Could not parse parameter table, trying alternative method")
                 # Alternative: directly search for parameter names and types
-                param_sections = re.findall(r'```\s*([A-Za-z0-9_]+)\s+([a-z]+)\s+(.*?)(?=```)', params_content, re.DOTALL)
-                required_sections = re.findall(r'```\s*(Yes|No)\s*```', params_content, re.DOTALL)
+                param_sections = _PARAM_BLOCK.findall(params_content)
+                required_sections = _REQUIRED_BLOCK.findall(params_content)
                 
                 # Ensure we have equal numbers of parameters and required info
                 if len(param_sections) == len(required_sections):
                     for i, (param_name, param_type, description) in enumerate(param_sections):
-                        if param_name not in ["Parametername", "Type", "Description", "Required"]:
+                        if param_name not in _BLOCK_HEADER_NAMES:
                             required = required_sections[i].strip().lower() == "yes"
                             parameters.append({
                                 "name": param_name,
@@ -132,26 +257,26 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
                                 "description": description.strip(),
                                 "required": required
                             })
-                    logger.info(f"Using alternative method, found {len(parameters)} parameters")
+                    logger.info("Using alternative method, found %d parameters", len(parameters))
         
         # 如果仍然找不到参数，直接从文本中提取
         if not parameters:
             logger.warning("Trying to extract parameters directly from text")
             # Look for obvious parameter patterns
-            param_matches = re.finditer(r'```\s*([A-Za-z0-9_]+)\s+([a-z]+).*?```.*?```\s*(Yes|No)\s*```', params_content, re.DOTALL)
+            param_matches = _PARAM_DIRECT.finditer(params_content)
             for match in param_matches:
                 param_name = match.group(1).strip()
                 param_type = match.group(2).strip().lower()
                 required = match.group(3).strip().lower() == "yes"
                 
-                if param_name not in ["Parametername", "Type", "Description", "Required"]:
+                if param_name not in _BLOCK_HEADER_NAMES:
                     parameters.append({
                         "name": param_name,
                         "type": param_type,
                         "description": f"Parameter {param_name}",
                         "required": required
                     })
-            logger.info(f"Extracted {len(parameters)} parameters directly from text")
+            logger.info("Extracted %d parameters directly from text", len(parameters))
         
         # 确保我们至少有一些参数
         if not parameters:
@@ -163,8 +288,9 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
             ]
         
         # 记录所有找到的参数
-        for param in parameters:
-            logger.info(f"Parameter: {param['name']}, Type: {param['type']}, Required: {param['required']}")
+        if logger.isEnabledFor(logging.INFO):
+            for param in parameters:
+                logger.info("Parameter: %s, Type: %s, Required: %s", param['name'], param['type'], param['required'])
             
         return {
             "path": api_path,
@@ -172,7 +298,7 @@ def parse_markdown_api_doc(md_file_path: str) -> Optional[Dict[str, Any]]:
             "parameters": parameters
         }
     except Exception as e:
-        logger.error(f"Error parsing Markdown file: {str(e)}")
+        logger.error("Error parsing Markdown file: %s", e)
         return None
 
 
@@ -198,37 +324,77 @@ def generate_testcases(endpoint: Endpoint, base_url: str) -> List[TestCase]:
     Returns:
         A list of TestCase objects
     """
+    # Split the parameters once; every generator receives the same tuples
+    request_body = endpoint.request_body
+    params = tuple(request_body.parameters) if request_body else ()
+    required = tuple(p for p in params if p.required)
+    optional = tuple(p for p in params if not p.required)
+    
     test_cases = []
     
     # Generate happy path tests
-    test_cases.extend(create_happy_path_tests(endpoint, base_url))
+    test_cases.extend(create_happy_path_tests(endpoint, base_url, params, required, optional))
     
     # Generate equivalence class tests
-    test_cases.extend(create_equivalence_class_tests(endpoint, base_url))
+    test_cases.extend(create_equivalence_class_tests(endpoint, base_url, params, required, optional))
     
     # Generate boundary value tests
-    test_cases.extend(create_numeric_boundary_tests(endpoint, base_url))
-    test_cases.extend(create_string_boundary_tests(endpoint, base_url))
+    test_cases.extend(create_numeric_boundary_tests(endpoint, base_url, params, required, optional))
+    test_cases.extend(create_string_boundary_tests(endpoint, base_url, params, required, optional))
     
     # Generate negative tests
-    test_cases.extend(create_missing_param_tests(endpoint, base_url))
-    test_cases.extend(create_invalid_type_tests(endpoint, base_url))
-    test_cases.extend(create_invalid_format_tests(endpoint, base_url))
+    test_cases.extend(create_missing_param_tests(endpoint, base_url, params, required, optional))
+    test_cases.extend(create_invalid_type_tests(endpoint, base_url, params, required, optional))
+    test_cases.extend(create_invalid_format_tests(endpoint, base_url, params, required, optional))
     
     # Generate combination tests
-    test_cases.extend(create_param_combination_tests(endpoint, base_url))
+    test_cases.extend(create_param_combination_tests(endpoint, base_url, params, required, optional))
     
     # Generate special case tests
-    test_cases.extend(create_special_case_tests(endpoint, base_url))
+    test_cases.extend(create_special_case_tests(endpoint, base_url, params, required, optional))
     
     # Generate documentation validation tests
-    test_cases.extend(create_documentation_tests(endpoint, base_url))
+    test_cases.extend(create_documentation_tests(endpoint, base_url, params, required, optional))
     
-    logger.info(f"Generated {len(test_cases)} test cases")
+    logger.info("Generated %d test cases", len(test_cases))
     return test_cases 
 
 
-def create_happy_path_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+@functools.lru_cache(maxsize=None)
+def _shared_validations() -> Tuple[Validation, Validation, Validation, Validation]:
+    """Build the invariant happy-path validations once; test cases share them and nothing mutates them.
+    
+    Returns:
+        (status 200, RetCode 0, RetCode 0 with description, Action field exists)
+    """
+    from src.models.test_case import Validation, ValidationType
+    
+    return (
+        Validation(
+            type=ValidationType.STATUS_CODE,
+            expected=200
+        ),
+        Validation(
+            type=ValidationType.JSON_FIELD,
+            field="RetCode",
+            expected=0
+        ),
+        Validation(
+            type=ValidationType.JSON_FIELD,
+            field="RetCode",
+            expected=0,
+            description="API should return success code 0"
+        ),
+        Validation(
+            type=ValidationType.JSON_FIELD_EXISTS,
+            field="Action",
+            description="Response should include Action field"
+        )
+    )
+
+
+def create_happy_path_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create happy path tests for an API endpoint.
     
     These tests cover the basic functionality of the endpoint with valid inputs.
@@ -236,223 +402,201 @@ def create_happy_path_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]
     Args:
         endpoint: The API endpoint
         base_url: Base URL for the API
+        params: All request body parameters in document order
+        required: The required parameters from params
+        optional: The optional parameters from params
         
     Returns:
         A list of TestCase objects
     """
+    from src.models.test_case import TestCase, TestCaseType
+    
+    status_ok, retcode_ok, retcode_ok_described, action_exists = _shared_validations()
+    path = endpoint.path
     tests = []
     
     # 1. Minimal test - only required parameters
-    minimal_test = TestCase(
+    tests.append(TestCase(
         name=f"Happy Path - Required Parameters Only",
         description=f"Test with only the required parameters",
         method="POST",
-        path=endpoint.path,
+        path=path,
         test_type=TestCaseType.REQUIRED_PARAMS_ONLY,
+        # Add all required parameters
+        request_data={param.name: generate_valid_value(param) for param in required},
+        # Add standard headers
+        headers={"Content-Type": "application/json"},
+        validations=[status_ok, retcode_ok_described, action_exists],
         base_url=base_url
-    )
-    
-    # Add all required parameters
-    for param in endpoint.request_body.parameters if endpoint.request_body else []:
-        if param.required:
-            minimal_test.request_data[param.name] = generate_valid_value(param)
-    
-    # Add standard headers
-    minimal_test.headers["Content-Type"] = "application/json"
-    
-    # Add validations
-    minimal_test.validations.append(Validation(
-        type=ValidationType.STATUS_CODE,
-        expected=200
-    ))
-    minimal_test.validations.append(Validation(
-        type=ValidationType.JSON_FIELD,
-        field="RetCode",
-        expected=0,
-        description="API should return success code 0"
-    ))
-    minimal_test.validations.append(Validation(
-        type=ValidationType.JSON_FIELD_EXISTS,
-        field="Action",
-        description="Response should include Action field"
     ))
     
-    tests.append(minimal_test)
-    
     # 2. Partial optional parameters test
-    # 修复语法错误：创建可读性更高的条件检查
-    optional_params_exist = False
-    if endpoint.request_body:
-        optional_params_exist = any(not param.required for param in endpoint.request_body.parameters)
-    
-    if optional_params_exist:
-        partial_test = TestCase(
+    if optional:
+        tests.append(TestCase(
             name=f"Happy Path - Required + Some Optional Parameters",
             description=f"Test with required parameters and some optional parameters",
             method="POST",
-            path=endpoint.path,
+            path=path,
             test_type=TestCaseType.PARTIAL_OPTIONAL_PARAMS,
+            # All required parameters plus the first half of the optional ones
+            request_data={param.name: generate_valid_value(param) for param in required + optional[:len(optional)//2]},
+            headers={"Content-Type": "application/json"},
+            validations=[status_ok, retcode_ok],
             base_url=base_url
-        )
-        
-        # Add all required parameters
-        for param in endpoint.request_body.parameters if endpoint.request_body else []:
-            if param.required:
-                partial_test.request_data[param.name] = generate_valid_value(param)
-        
-        # Add some optional parameters (first half of them)
-        optional_params = [p for p in (endpoint.request_body.parameters if endpoint.request_body else []) if not p.required]
-        for param in optional_params[:len(optional_params)//2]:
-            partial_test.request_data[param.name] = generate_valid_value(param)
-        
-        # Add headers and validations
-        partial_test.headers["Content-Type"] = "application/json"
-        partial_test.validations.append(Validation(
-            type=ValidationType.STATUS_CODE,
-            expected=200
-        ))
-        partial_test.validations.append(Validation(
-            type=ValidationType.JSON_FIELD,
-            field="RetCode",
-            expected=0
         ))
-        
-        tests.append(partial_test)
     
     # 3. All parameters test
-    if optional_params_exist:
-        full_test = TestCase(
+    if optional:
+        tests.append(TestCase(
             name=f"Happy Path - All Parameters",
             description=f"Test with all parameters (required and optional)",
             method="POST",
-            path=endpoint.path,
+            path=path,
             test_type=TestCaseType.ALL_PARAMS,
+            request_data={param.name: generate_valid_value(param) for param in params},
+            headers={"Content-Type": "application/json"},
+            validations=[status_ok, retcode_ok],
             base_url=base_url
-        )
-        
-        # Add all parameters
-        for param in endpoint.request_body.parameters if endpoint.request_body else []:
-            full_test.request_data[param.name] = generate_valid_value(param)
-        
-        # Add headers and validations
-        full_test.headers["Content-Type"] = "application/json"
-        full_test.validations.append(Validation(
-            type=ValidationType.STATUS_CODE,
-            expected=200
         ))
-        full_test.validations.append(Validation(
-            type=ValidationType.JSON_FIELD,
-            field="RetCode",
-            expected=0
-        ))
-        
-        tests.append(full_test)
     
     return tests 
 
 
-def generate_valid_value(param: Parameter) -> Any:
+# Random generator shared by the value generators in this module
+_RNG = random.Random()
+
+_NUMERIC_TYPES = frozenset({"integer", "int", "number"})
+_BOOLEAN_TYPES = frozenset({"boolean", "bool"})
+
+# Substrings of a lowercased string parameter name that select its value format
+_ID_TERMS = ("id", "uuid", "guid")
+_NAME_TERMS = ("name", "title")
+# Fixed values for string parameters that must hold real-looking data
+_SPECIAL_PARAM_VALUES = {"Region": "cn-bj2", "Zone": "cn-bj2-02"}
+
+
+def generate_valid_value(param: Parameter, rng: random.Random = _RNG) -> Any:
     """Generate valid parameter values based on parameter type.
     
     Args:
         param: The parameter definition
+        rng: Random generator to draw values from; defaults to the shared module instance,
+            parallel workers can pass their own
         
     Returns:
         A valid value for the parameter
     """
     p_type = param.type.lower()
     
-    if p_type in ["integer", "int", "number"]:
+    if p_type in _NUMERIC_TYPES:
         # Generate a random integer between 1 and 100
-        return random.randint(1, 100)
+        return rng.randint(1, 100)
     elif p_type == "string":
+        # For region or zone parameters, use predefined values
+        # (neither name contains an ID or name hint, so checking them first is safe)
+        special_value = _SPECIAL_PARAM_VALUES.get(param.name)
+        if special_value is not None:
+            return special_value
+        lower_name = param.name.lower()
         # For ID-like parameters, generate a proper ID format
-        if any(term in param.name.lower() for term in ["id", "uuid", "guid"]):
-            return f"test-{random.randint(10000, 99999)}"
+        if any(term in lower_name for term in _ID_TERMS):
+            return f"test-{rng.randint(10000, 99999)}"
         # For name-like parameters
-        elif any(term in param.name.lower() for term in ["name", "title"]):
-            return f"Test {param.name} {random.randint(1, 100)}"
-        # For region or zone parameters, use predefined values
-        elif param.name == "Region":
-            return "cn-bj2"
-        elif param.name == "Zone":
-            return "cn-bj2-02"
+        elif any(term in lower_name for term in _NAME_TERMS):
+            return f"Test {param.name} {rng.randint(1, 100)}"
         # For other string parameters
         else:
-            return f"test-value-{random.randint(1, 100)}"
-    elif p_type in ["boolean", "bool"]:
+            return f"test-value-{rng.randint(1, 100)}"
+    elif p_type in _BOOLEAN_TYPES:
         return True
     elif p_type == "array":
         # Generate an array with 2-3 items
-        item_count = random.randint(2, 3)
+        item_count = rng.randint(2, 3)
         return [f"item-{i}" for i in range(item_count)]
     elif p_type == "object":
         # Generate a simple object with one key-value pair
-        return {"key": f"value-{random.randint(1, 100)}"}
+        return {"key": f"value-{rng.randint(1, 100)}"}
     else:
         # For unknown types, return a string representation
-        return f"value-for-{param.name}-{random.randint(1, 100)}" 
+        return f"value-for-{param.name}-{rng.randint(1, 100)}" 
 
 
-def create_equivalence_class_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_equivalence_class_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create equivalence class tests that cover parameter combinations"""
     # 简化版的实现，仅包含必要的代码结构
     return []
 
-def create_numeric_boundary_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_numeric_boundary_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create tests for numeric boundary values"""
     # 简化版的实现
     return []
 
-def create_string_boundary_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_string_boundary_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create tests for string boundary values"""
     # 简化版的实现
     return []
 
-def create_missing_param_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_missing_param_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create tests for missing parameters"""
     # 简化版的实现
     return []
 
-def create_invalid_type_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_invalid_type_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create tests for invalid parameter types"""
     # 简化版的实现
     return []
 
-def create_invalid_format_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_invalid_format_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create tests for invalid parameter formats"""
     # 简化版的实现
     return []
 
-def create_param_combination_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_param_combination_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create tests for parameter combinations"""
     # 简化版的实现
     return []
 
-def create_special_case_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_special_case_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create special case tests"""
     # 简化版的实现
     return []
 
-def create_documentation_tests(endpoint: Endpoint, base_url: str) -> List[TestCase]:
+def create_documentation_tests(endpoint: Endpoint, base_url: str, params: Tuple[Parameter, ...],
+        required: Tuple[Parameter, ...], optional: Tuple[Parameter, ...]) -> List[TestCase]:
     """Create documentation validation tests"""
     # 简化版的实现
     return []
 
 
-def main():
-    """Main function to parse arguments and execute the script"""
-    parser = argparse.ArgumentParser(description="Generate structured test cases from Markdown API docs")
-    parser.add_argument("-f", "--file", required=True, help="Markdown API document file path")
-    parser.add_argument("-u", "--url", required=True, help="Base URL for API endpoints")
-    args = parser.parse_args()
+def build_test_case_collection(md_file_path: str, base_url: str,
+        cache_dir: Optional[str] = None) -> Optional[TestCaseCollection]:
+    """Parse a Markdown API document and build its structured test case collection.
+    
+    Args:
+        md_file_path: Markdown API document file path
+        base_url: Base URL for API endpoints
+        cache_dir: Parse cache directory passed to parse_markdown_api_doc, or None
+        
+    Returns:
+        The generated TestCaseCollection, or None if the document could not be parsed
+    """
+    from src.models.test_case import TestCaseCollection
+    from src.models.api_schema import Endpoint, Parameter, RequestBody
     
     # Parse markdown document
-    api_info = parse_markdown_api_doc(args.file)
+    api_info = parse_markdown_api_doc(md_file_path, cache_dir)
     
     if not api_info:
         logger.error("Failed to parse API document")
-        sys.exit(1)
+        return None
     
     path = api_info.get("path", "")
     description = api_info.get("description", "")
@@ -479,27 +623,123 @@ def main():
     )
     
     # Generate test cases using the unified function
-    base_url = args.url
     test_cases = generate_testcases(endpoint, base_url)
     
     # Create test case collection
-    collection = TestCaseCollection(
+    return TestCaseCollection(
         name=f"Test Collection for {path}",
         description=f"Comprehensive test suite for {description}",
         test_cases=test_cases
     )
+
+
+def _reseed_worker() -> None:
+    """Process pool initializer: reseed the inherited generator so workers draw different values"""
+    _RNG.seed()
+
+
+def _generate_for_file(md_file_path: str, base_url: str, cache_dir: Optional[str]) -> List[TestCase]:
+    """Generate the test cases of one Markdown API document; an empty list if it cannot be parsed"""
+    collection = build_test_case_collection(md_file_path, base_url, cache_dir)
+    return collection.test_cases if collection else []
+
+
+def build_test_case_collection_from_dir(md_dir: str, base_url: str,
+        cache_dir: Optional[str] = None) -> Optional[TestCaseCollection]:
+    """Build one structured test case collection from every Markdown API document in a directory.
+    
+    The documents are independent, so with more than one of them each is
+    generated in its own worker process.
+    
+    Args:
+        md_dir: Directory containing Markdown API documents (*.md)
+        base_url: Base URL for API endpoints
+        cache_dir: Parse cache directory passed to parse_markdown_api_doc, or None
+        
+    Returns:
+        The merged TestCaseCollection, or None if no document could be parsed
+    """
+    from src.models.test_case import TestCaseCollection
+    
+    md_files = sorted(str(path) for path in Path(md_dir).glob("*.md"))
+    if not md_files:
+        logger.error("No Markdown files found in %s", md_dir)
+        return None
+    
+    if len(md_files) > 1:
+        with ProcessPoolExecutor(initializer=_reseed_worker) as executor:
+            results = list(executor.map(_generate_for_file, md_files, repeat(base_url), repeat(cache_dir), chunksize=4))
+    else:
+        results = [_generate_for_file(md_files[0], base_url, cache_dir)]
+    
+    test_cases = [test_case for file_cases in results for test_case in file_cases]
+    if not test_cases:
+        logger.error("Failed to generate test cases from the documents in %s", md_dir)
+        return None
+    
+    return TestCaseCollection(
+        name=f"Test Collection for {md_dir}",
+        description=f"Comprehensive test suite for {len(md_files)} API documents",
+        test_cases=test_cases
+    )
+
+
+def dump_collection(collection: TestCaseCollection, f) -> None:
+    """Write a test case collection as indented JSON, one test case at a time.
+    
+    Produces the same output as ``json.dump(collection.to_dict(), f, indent=2,
+    ensure_ascii=False)`` without materializing the dict form of every test case.
+    Each test case is encoded with dumps_pretty, which uses orjson when it is installed.
+    
+    Args:
+        collection: The collection to serialize
+        f: Text file object to write to
+    """
+    f.write('{\n  "name": ')
+    f.write(dumps_pretty(collection.name))
+    f.write(',\n  "description": ')
+    f.write(dumps_pretty(collection.description))
+    f.write(',\n  "test_cases": [')
+    
+    for index, test_case in enumerate(collection.test_cases):
+        f.write(',\n    ' if index else '\n    ')
+        # Encoded JSON strings never contain raw newlines, so re-indenting chunks is safe
+        f.write(dumps_pretty(test_case.to_dict()).replace('\n', '\n    '))
+    
+    f.write('\n  ]\n}' if collection.test_cases else ']\n}')
+
+
+def main():
+    """Main function to parse arguments and execute the script"""
+    parser = argparse.ArgumentParser(description="Generate structured test cases from Markdown API docs")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("-f", "--file", help="Markdown API document file path")
+    source.add_argument("-d", "--dir", help="Directory of Markdown API documents, generated in parallel")
+    parser.add_argument("-u", "--url", required=True, help="Base URL for API endpoints")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"Reuse parse results of unchanged documents, stored in {_PARSE_CACHE_DIR}")
+    args = parser.parse_args()
+    
+    cache_dir = _PARSE_CACHE_DIR if args.cache else None
+    if args.dir:
+        collection = build_test_case_collection_from_dir(args.dir, args.url, cache_dir)
+    else:
+        collection = build_test_case_collection(args.file, args.url, cache_dir)
+    
+    if collection is None:
+        sys.exit(1)
     
     # Prepare output directory and file
     reports_dir = os.path.join(project_root, "reports")
     os.makedirs(reports_dir, exist_ok=True)
     output_file = os.path.join(reports_dir, "structured_test_cases.json")
     
-    # Save the test cases
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(collection.to_dict(), f, indent=2, ensure_ascii=False)
+    # Save the test cases; the file is only replaced once the whole collection is written
+    with atomic_open(output_file) as f:
+        dump_collection(collection, f)
     
-    logger.info(f"Test cases successfully saved to {output_file}")
-    logger.info(f"Generated {len(collection.test_cases)} test cases")
+    logger.info("Test cases successfully saved to %s", output_file)
+    logger.info("Generated %d test cases", len(collection.test_cases))
     
     print(f"Generated test cases saved to: {output_file}")
     return output_file
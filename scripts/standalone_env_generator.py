@@ -12,6 +12,35 @@ import os
 import uuid
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library is enough
+    orjson = None
+
+# Random bytes for environment IDs, read from os.urandom in blocks instead of once per file
+_ID_BLOCK_SIZE = 4096
+_ID_POOL = b""
+_ID_POS = 0
+
+def _reset_id_pool():
+    """Drops the pooled bytes so a forked child never reuses the parent's unused IDs"""
+    global _ID_POOL, _ID_POS
+    _ID_POOL = b""
+    _ID_POS = 0
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+def _new_environment_id():
+    """Returns a random version 4 UUID string, taking its 16 bytes from the pre-read pool"""
+    global _ID_POOL, _ID_POS
+    if _ID_POS + 16 > len(_ID_POOL):
+        _ID_POOL = os.urandom(_ID_BLOCK_SIZE)
+        _ID_POS = 0
+    random_bytes = _ID_POOL[_ID_POS:_ID_POS + 16]
+    _ID_POS += 16
+    return str(uuid.UUID(bytes=random_bytes, version=4))
+
 def generate_environment_file(
     output_path, 
     env_vars=None, 
@@ -39,7 +68,7 @@ def generate_environment_file(
     
     # Create environment file structure
     env_data = {
-        "id": str(uuid.uuid4()),
+        "id": _new_environment_id(),
         "name": env_name,
         "values": [
             {
@@ -59,9 +88,20 @@ def generate_environment_file(
     if dir_name:
         os.makedirs(dir_name, exist_ok=True)
     
-    # Write environment file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(env_data, f, indent=2, ensure_ascii=False)
+    # Write environment file to a temporary file first and move it into place,
+    # so an interrupted run never leaves a partial file behind
+    tmp_path = f"{output_path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(env_data, option=orjson.OPT_INDENT_2).decode('utf-8'))
+            else:
+                json.dump(env_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     
     print(f"环境文件已生成: {output_path}")
     return output_path
@@ -153,6 +193,44 @@ def parse_arguments():
     
     return parser.parse_args()
 
+def run_project_env_command(args):
+    """
+    Runs the project's "env" command for the --ai mode.
+    
+    When this script sits inside the API Test AI project, the command is called in
+    this process; otherwise (or if the project's dependencies are missing) it falls
+    back to running src/main.py in a new interpreter.
+    
+    Args:
+        args: Parsed command line arguments of this script
+    """
+    import sys
+    
+    output = args.output if args.output != "reports/environment.json" else None
+    name = args.name
+    
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.append(project_root)
+    try:
+        from src.main import load_config, run_env_command
+    except ImportError:
+        run_env_command = None
+    
+    if run_env_command is not None:
+        env_args = argparse.Namespace(url=args.url, output=output, name=name, vars=None)
+        if run_env_command(env_args, load_config(), None) != 0:
+            raise RuntimeError("env command failed")
+        return
+    
+    import subprocess
+    cmd = [sys.executable, "src/main.py", "env", "-u", args.url]
+    if output is not None:
+        cmd.extend(["-o", output])
+    if name != "API Test AI Environment":
+        cmd.extend(["-n", name])
+    subprocess.run(cmd, check=True, close_fds=False, env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+
 def main():
     """Main entry point"""
     args = parse_arguments()
@@ -160,15 +238,8 @@ def main():
     # Check if AI mode is enabled
     if args.ai:
         try:
-            import sys
-            import subprocess
-            cmd = [sys.executable, "src/main.py", "env", "-u", args.url]
-            if args.output != "reports/environment.json":
-                cmd.extend(["-o", args.output])
-            if args.name != "API Test AI Environment":
-                cmd.extend(["-n", args.name])
             print("使用AI增强模式生成环境文件...")
-            result = subprocess.run(cmd, check=True)
+            run_project_env_command(args)
             return
         except Exception as e:
             print(f"AI模式启动失败: {str(e)}")
@@ -198,12 +269,14 @@ def main():
             print(f"从{args.file}加载环境变量时出错: {str(e)}")
     
     # 2. Add command line variables
-    if args.vars:
-        for var_str in args.vars:
-            if '=' in var_str:
-                key, value = var_str.split('=', 1)
-                env_vars[key] = value
-                print(f"已添加命令行环境变量: {key}")
+    cli_keys = []
+    for var_str in args.vars or ():
+        key, sep, value = var_str.partition('=')
+        if sep:
+            env_vars[key] = value
+            cli_keys.append(key)
+    if cli_keys:
+        print(f"已添加命令行环境变量: {', '.join(cli_keys)}")
     
     # 3. Add specific variables if provided
     if args.url:
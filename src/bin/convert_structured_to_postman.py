@@ -4,15 +4,57 @@ import sys
 import argparse
 import json
 
+try:
+    import ijson
+except ImportError:  # ijson is optional, fall back to loading the whole file
+    ijson = None
+
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.utils.postman_adapter import PostmanAdapter
-from src.models.test_case import TestCaseCollection
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def load_test_case_collection(input_file):
+    """
+    Load a structured test case file into a TestCaseCollection
+    
+    With ijson installed the test cases are parsed one at a time, so only the
+    TestCase objects are kept in memory instead of the whole parsed document as well.
+    
+    Args:
+        input_file: Structured test cases file path
+        
+    Returns:
+        The loaded TestCaseCollection
+    """
+    from src.models.test_case import TestCase, TestCaseCollection
+    
+    if ijson is None:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            return TestCaseCollection.from_dict(json.load(f))
+    
+    with open(input_file, 'rb') as f:
+        # First pass: only the top-level name and description, which the
+        # generator writes before the test cases
+        header = {}
+        for prefix, event, value in ijson.parse(f):
+            if prefix in ("name", "description") and event == "string":
+                header[prefix] = value
+                if len(header) == 2:
+                    break
+        
+        f.seek(0)
+        collection = TestCaseCollection(
+            name=header.get("name", "Unnamed Collection"),
+            description=header.get("description", "")
+        )
+        for test_case in ijson.items(f, "test_cases.item", use_float=True):
+            collection.test_cases.append(TestCase.from_dict(test_case))
+    
+    return collection
+
 def main():
     """
     Command-line tool to convert structured test cases to Postman format
@@ -39,22 +81,20 @@ def main():
         output_file = os.path.join(output_dir, f"{input_filename}_postman.json")
     
     try:
-        logger.info(f"Starting conversion of structured test cases {input_file} to Postman collection format...")
+        logger.info("Starting conversion of structured test cases %s to Postman collection format...", input_file)
         
         # Load test case collection
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        collection = TestCaseCollection.from_dict(data)
+        collection = load_test_case_collection(input_file)
         
-        # Convert to Postman format
+        # Convert to Postman format; the adapter is only loaded once the arguments are valid
+        from src.utils.postman_adapter import PostmanAdapter
         adapter = PostmanAdapter()
         adapter.convert_test_case_collection_to_postman_file(collection, output_file)
         
-        logger.info(f"Conversion successful! Postman collection saved to: {output_file}")
+        logger.info("Conversion successful! Postman collection saved to: %s", output_file)
         return 0
     except Exception as e:
-        logger.error(f"Conversion failed: {str(e)}")
+        logger.error("Conversion failed: %s", e)
         return 1
 
 if __name__ == "__main__":
@@ -1,14 +1,231 @@
 import re
 import fitz  # PyMuPDF
 import logging
-import json
+import os
+import sys
+import copy
+import functools
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Optional, Any, Tuple
 
 from src.models.api_schema import APISchema, Endpoint, Parameter, RequestBody, Response
+from src.utils.json_utils import dumps_compact
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 预编译的正则表达式
+_API_NAME_RE = re.compile(r'[a-zA-Z]+UDB[a-zA-Z]+')
+_DESCRIBE_NAME_RE = re.compile(r'Describe[a-zA-Z]+')
+# 以两个以上空白分隔的参数行: 参数名、类型、描述和可选的是否必填列 (其后的列忽略)
+# 每列是不含连续空白的文本，(?=(...))\N 相当于原子分组，避免列之间的回溯
+_PARAM_LINE_RE = re.compile(
+    r'(?=(\S+(?:\s\S+)*))\1\s{2,}(?=(\S+(?:\s\S+)*))\2\s{2,}(?=(\S+(?:\s\S+)*))\3'
+    r'(?:\s{2,}(?=(\S+(?:\s\S+)*))\4)?'
+)
+_TABLE_RE = re.compile(r'<table[^>]*>(.*?)</table>', re.DOTALL)
+_TR_RE = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL)
+_TD_RE = re.compile(r'<t[hd][^>]*>(.*?)</t[hd]>', re.DOTALL)
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+_API_SECTION_RE = re.compile(r'(?i)(?:接口(?:说明)?|API(?:列表)?)[:：\s]')
+_PATH_RE = re.compile(r'(?:路径|地址|Path|URL)[：:]\s*(/[^\s\n]*)')
+_METHOD_RE = re.compile(r'(?:方法|Method|请求方式)[：:]\s*(GET|POST|PUT|DELETE|PATCH)', re.IGNORECASE)
+_DESC_RE = re.compile(r'(?:描述|说明|Description)[：:]\s*([^\n]*)')
+_URL_PATH_RE = re.compile(r'(/[a-zA-Z0-9\-_/{}]+)')
+# 参数名只从单词开头匹配，(?=(\w+))\1 相当于原子分组，避免 \w+ 与 [^\n|]* 之间的回溯
+_FEISHU_PARAM_ROW_RE = re.compile(r'(?<!\w)(?=(\w+))\1[^\n|]*[|｜][^\n|]*[|｜][^\n|]*[|｜]([^\n]+)')
+_REQUIRED_MARK_RE = re.compile(r'(?:必填|是|true|required)', re.IGNORECASE)
+_FEISHU_PARAM_ITEM_RE = re.compile(r'[●\-*]\s*(\w+)[：:]\s*([^\n]+)')
+_STATUS_RE = re.compile(r'(?:状态码|code)[：:]\s*(\d{3})')
+_RESPONSE_DESC_RE = re.compile(r'(?:描述|说明|message)[：:]\s*([^\n]+)')
+_TYPE_RE = re.compile(r'(?:类型|type)[：:]\s*(\w+)')
+_TITLE_RE = re.compile(r"(?i)API\s+Reference.*?[\r\n]+(.*?)[\r\n]+")
+_DESCRIPTION_RE = re.compile(r"(?i)Description[\s:]+(.*?)(?=\n\n|\n[A-Z])")
+_BASE_URL_RE = re.compile(r"(?i)Base\s+URL\s*[:\-]?\s*(https?://[^\s\n]+)")
+_ENDPOINT_RE = re.compile(r"(?i)(GET|POST|PUT|DELETE|PATCH)\s+(/[a-z0-9/\-_{}]+)")
+_PARAM_SIGNATURE_RE = re.compile(r"(\w+)\s+\((\w+)(?:,\s*required)?\)\s*-\s*([^\n]+)")
+_STATUS_LINE_RE = re.compile(r"(\d{3})\s*-\s*([^\n]+)")
+
+# 按名称索引所有预编译的正则表达式
+_PATTERNS = {
+    'api_name': _API_NAME_RE,
+    'describe_name': _DESCRIBE_NAME_RE,
+    'param_line': _PARAM_LINE_RE,
+    'table': _TABLE_RE,
+    'tr': _TR_RE,
+    'td': _TD_RE,
+    'tag_strip': _TAG_STRIP_RE,
+    'api_section': _API_SECTION_RE,
+    'path': _PATH_RE,
+    'method': _METHOD_RE,
+    'desc': _DESC_RE,
+    'url_path': _URL_PATH_RE,
+    'feishu_param_row': _FEISHU_PARAM_ROW_RE,
+    'required_mark': _REQUIRED_MARK_RE,
+    'feishu_param_item': _FEISHU_PARAM_ITEM_RE,
+    'status': _STATUS_RE,
+    'response_desc': _RESPONSE_DESC_RE,
+    'type': _TYPE_RE,
+    'title': _TITLE_RE,
+    'description': _DESCRIPTION_RE,
+    'base_url': _BASE_URL_RE,
+    'endpoint': _ENDPOINT_RE,
+    'param_signature': _PARAM_SIGNATURE_RE,
+    'status_line': _STATUS_LINE_RE,
+}
+
+# 清理 PDF 文本的转换表: 删除 \x01、\r 以及康熙部首等特殊 Unicode 字符 (U+2F00 - U+2FFF)
+_CLEAN_TABLE = dict.fromkeys([0x01, 0x0D, *range(0x2F00, 0x3000)])
+
+# 带请求体的 HTTP 方法
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# 参数表中需要跳过的表头单词 (小写)
+_SKIP_NAMES = frozenset({'parameter', 'name', 'type'})
+
+# 文档中的类型名称 -> 标准参数类型，未列出的类型均视为 string
+_TYPE_ALIASES = {
+    'int': 'integer', 'integer': 'integer',
+    'bool': 'boolean', 'boolean': 'boolean',
+    'array': 'array', 'list': 'array',
+    'object': 'object', 'dict': 'object', 'map': 'object',
+    'number': 'number', 'float': 'number', 'double': 'number',
+}
+# 描述中 "类型: xxx" 写明的类型 (含中文名称) -> 标准参数类型
+_DESCRIBED_TYPE_ALIASES = {
+    'int': 'integer', 'integer': 'integer', '整数': 'integer',
+    'bool': 'boolean', 'boolean': 'boolean', '布尔': 'boolean',
+    'array': 'array', 'list': 'array', '数组': 'array', '列表': 'array',
+    'object': 'object', 'dict': 'object', '对象': 'object', '字典': 'object',
+    'number': 'number', 'float': 'number', 'double': 'number', '浮点': 'number',
+}
+
+# 从上下文推断端点时依次尝试的 HTTP 方法
+_HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+
+# 参数表之后可能出现的固定结束标记 (调用方传入的结束标记之外)
+_PARAM_SECTION_END_MARKERS = ("Request Example", "UDBInstanceSet", "Response Example")
+
+# 常规提取几乎没有文本时，依次尝试的 PyMuPDF 文本提取模式 (按优先级排列)
+_FALLBACK_EXTRACTION_MODES = ("text", "blocks", "words", "xhtml", "html", "json")
+# 某一模式提取到的文本超过该长度即认为该页提取成功
+_FALLBACK_MIN_PAGE_TEXT = 100
+
+# extract_from_pdf 基于规则提取的结果缓存: (绝对路径, mtime, 文件大小) -> APISchema
+_SCHEMA_CACHE: "OrderedDict[Tuple[str, int, int], APISchema]" = OrderedDict()
+_SCHEMA_CACHE_SIZE = 16
+
+# 判断是否为图片型 PDF 时抽查的页数
+_IMAGE_PROBE_PAGES = 3
+
+# 多进程提取时每个进程至少处理的页数；页数不够分给两个进程时顺序提取
+_PAGES_PER_WORKER = 16
+
+# UCloud DescribeUDBInstance 接口的全部请求参数 (完整的12个参数)，只在导入时构建一次
+_UDB_PARAMETERS = (
+    Parameter(
+        name="Region",
+        description="地域。参见 地域和可用区列表",
+        required=True,
+        type="string"
+    ),
+    Parameter(
+        name="Zone",
+        description="可用区，不填时默认全部可用区。参见 可用区列表",
+        required=False,
+        type="string"
+    ),
+    Parameter(
+        name="ProjectId",
+        description="项目ID。不填写为默认项目，子帐号必须填写。请参考GetProjectList接口",
+        required=False,
+        type="string"
+    ),
+    Parameter(
+        name="DBId",
+        description="DB实例id，如果指定则获取单个db实例的描述，否则为列表操作。指定DBId时无需填写ClassType、Offset、Limit",
+        required=False,
+        type="string"
+    ),
+    Parameter(
+        name="ClassType",
+        description="DB种类，如果是列表操作，则需要指定,不区分大小写，其取值如下：mysql: SQL；mongo: NOSQL；postgresql: postgresql",
+        required=False,
+        type="string"
+    ),
+    Parameter(
+        name="Offset",
+        description="分页显示起始偏移位置，列表操作时必填",
+        required=False,
+        type="integer"
+    ),
+    Parameter(
+        name="Limit",
+        description="分页显示数量，列表操作时必填",
+        required=False,
+        type="integer"
+    ),
+    Parameter(
+        name="IsInUDBC",
+        description="是否查看专区里面DB",
+        required=False,
+        type="boolean"
+    ),
+    Parameter(
+        name="UDBCId",
+        description="IsInUDBC为True,UDBCId为空，说明查看整个可用区的专区的db，如果UDBId不为空则只查看此专区下面的db",
+        required=False,
+        type="string"
+    ),
+    Parameter(
+        name="IncludeSlaves",
+        description="当只获取这个特定DBId的信息时，如果有该选项，那么把这个DBId实例的所有从库信息一起拉取并返回",
+        required=False,
+        type="boolean"
+    ),
+    Parameter(
+        name="VPCId",
+        description="根据VPCId筛选DB",
+        required=False,
+        type="string"
+    ),
+    Parameter(
+        name="Tag",
+        description="根据业务组筛选DB",
+        required=False,
+        type="string"
+    ),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _end_marker_pattern(end_marker: str) -> re.Pattern:
+    """构建匹配参数表任一结束标记的正则表达式，search 返回最早出现的标记"""
+    markers = (end_marker,) + _PARAM_SECTION_END_MARKERS
+    return re.compile("|".join(re.escape(marker) for marker in markers))
+
+
+def _find_all(text: str, *words: str) -> List[int]:
+    """返回各个单词在文本中所有出现位置的有序列表"""
+    positions = []
+    for word in words:
+        pos = text.find(word)
+        while pos != -1:
+            positions.append(pos)
+            pos = text.find(word, pos + 1)
+    positions.sort()
+    return positions
+
+
+def _strip_tags(html: str) -> str:
+    """将 HTML 标签替换为空格，不含标签的文本直接返回"""
+    if '<' not in html:
+        return html
+    return _TAG_STRIP_RE.sub(' ', html)
+
 
 class DocumentParser:
     """Extracts API information from PDF documents."""
@@ -20,75 +237,32 @@ class DocumentParser:
         """
         Extract API schema information from a PDF document.
         
+        Rule-based results are cached per file (keyed on path, modification time and
+        size), so parsing an unchanged file again returns a copy of the cached schema.
+        AI extraction and results without endpoints are never cached.
+        
         Args:
             file_path: Path to the PDF file
             
         Returns:
             APISchema object containing the extracted API information
         """
-        logger.info(f"Extracting API information from {file_path}")
+        cache_key = None
+        if not self.ai_client:
+            try:
+                stat = os.stat(file_path)
+                cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        
+        cached_schema = _SCHEMA_CACHE.get(cache_key) if cache_key else None
+        if cached_schema is not None:
+            _SCHEMA_CACHE.move_to_end(cache_key)
+            logger.info(f"Using cached API information for {file_path}")
+            return copy.deepcopy(cached_schema)
         
         try:
-            doc = fitz.open(file_path)
-            
-            # 增强文本提取
-            full_text = ""
-            
-            # 检查 PyMuPDF 版本
-            has_table_extraction = hasattr(fitz.Page, "find_tables")
-            logger.info(f"Table extraction available: {has_table_extraction}")
-            
-            for page_num, page in enumerate(doc):
-                # 提取常规文本 - 尝试多种格式
-                try:
-                    # 提取原始文本
-                    raw_text = page.get_text()
-                    full_text += raw_text + "\n\n"
-                    
-                    # 尝试提取结构化文本 (HTML 包含更多格式信息)
-                    if hasattr(page, "get_text"):
-                        html_text = page.get_text("html")
-                        # 从 HTML 中提取表格数据
-                        table_data = self._extract_tables_from_html(html_text)
-                        if table_data:
-                            full_text += "\n\nTABLE DATA:\n" + table_data
-                
-                except Exception as e:
-                    logger.warning(f"Error extracting text from page {page_num+1}: {str(e)}")
-                
-                # 记录进度
-                logger.debug(f"Processed page {page_num+1}/{len(doc)}")
-            
-            logger.debug(f"Extracted {len(full_text)} characters of text")
-            
-            # 如果文本太少，可能是解析问题
-            if len(full_text.strip()) < 100:
-                logger.warning("Very little text extracted from PDF. Document might be image-based or protected.")
-                # 尝试更激进的提取方法
-                full_text = self._extract_with_ocr_fallback(doc)
-            
-            # 如果 AI 客户端可用，使用它进行更好的提取
-            if self.ai_client:
-                logger.info("Using AI for API extraction")
-                return self._extract_with_ai(full_text, file_path)
-            else:
-                logger.info("AI client not available, using rule-based extraction")
-                
-                # 首先尝试从API文档风格中提取
-                api_schema = self._extract_from_api_doc_format(full_text, file_path)
-                
-                # 如果没有找到端点，尝试飞书格式
-                if not api_schema.endpoints:
-                    logger.info("No endpoints found with API doc format parsing, trying Feishu format")
-                    api_schema = self._extract_from_feishu_format(full_text, file_path)
-                
-                # 如果仍然没有找到端点，回退到标准提取
-                if not api_schema.endpoints:
-                    logger.info("No endpoints found with Feishu format parsing, trying standard extraction")
-                    api_schema = self._extract_with_rules(full_text, file_path)
-                
-                return api_schema
-                
+            api_schema = self._extract_from_pdf_file(file_path)
         except Exception as e:
             logger.error(f"Error extracting API info from PDF: {str(e)}")
             # 创建一个空的 API schema 作为回退
@@ -97,27 +271,156 @@ class DocumentParser:
                 description=f"Failed to extract API schema from {file_path}. Error: {str(e)}",
                 endpoints=[]
             )
+        
+        if cache_key and api_schema.endpoints:
+            _SCHEMA_CACHE[cache_key] = copy.deepcopy(api_schema)
+            if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+                _SCHEMA_CACHE.popitem(last=False)
+        return api_schema
+    
+    def _extract_from_pdf_file(self, file_path: str) -> APISchema:
+        """解析 PDF 文件并提取 API 信息 (不使用缓存，出错时抛出异常)"""
+        logger.info(f"Extracting API information from {file_path}")
+        
+        doc = fitz.open(file_path)
+        
+        # 增强文本提取 - 先收集各部分，最后一次性拼接
+        text_parts = []
+        
+        # 检查 PyMuPDF 版本
+        has_table_extraction = hasattr(fitz.Page, "find_tables")
+        logger.info(f"Table extraction available: {has_table_extraction}")
+        
+        page_count = len(doc)
+        if self._looks_image_based(doc):
+            # 扫描件逐页提取不到文本，直接交给下面的备用提取方法
+            logger.info("First pages contain images but no text, skipping regular text extraction")
+        elif page_count >= 2 * _PAGES_PER_WORKER and (os.cpu_count() or 1) > 1:
+            text_parts = self._extract_pages_parallel(doc, file_path, has_table_extraction)
+        else:
+            for page_num, page in enumerate(doc):
+                text_parts.extend(self._extract_page_text(page, page_num, page_count, has_table_extraction))
+        
+        full_text = "".join(text_parts)
+        logger.debug(f"Extracted {len(full_text)} characters of text")
+        
+        # 如果文本太少，可能是解析问题
+        if len(full_text.strip()) < 100:
+            logger.warning("Very little text extracted from PDF. Document might be image-based or protected.")
+            # 尝试更激进的提取方法
+            full_text = self._extract_with_ocr_fallback(doc)
+        
+        # 如果 AI 客户端可用，使用它进行更好的提取
+        if self.ai_client:
+            logger.info("Using AI for API extraction")
+            return self._extract_with_ai(full_text, file_path)
+        else:
+            logger.info("AI client not available, using rule-based extraction")
+            
+            # 首先尝试从API文档风格中提取
+            api_schema = self._extract_from_api_doc_format(full_text, file_path)
+            
+            # 如果没有找到端点，尝试飞书格式
+            if not api_schema.endpoints:
+                logger.info("No endpoints found with API doc format parsing, trying Feishu format")
+                api_schema = self._extract_from_feishu_format(full_text, file_path)
+            
+            # 如果仍然没有找到端点，回退到标准提取
+            if not api_schema.endpoints:
+                logger.info("No endpoints found with Feishu format parsing, trying standard extraction")
+                api_schema = self._extract_with_rules(full_text, file_path)
+            
+            return api_schema
+    
+    def _looks_image_based(self, doc) -> bool:
+        """抽查前几页: 都没有文本但都包含图片时，认为是扫描件等图片型 PDF"""
+        probe_count = min(len(doc), _IMAGE_PROBE_PAGES)
+        if probe_count == 0:
+            return False
+        
+        for page_num in range(probe_count):
+            page = doc[page_num]
+            if page.get_text().strip() or not page.get_images():
+                return False
+        return True
+    
+    def _extract_page_text(self, page, page_num: int, page_count: int, has_table_extraction: bool) -> List[str]:
+        """提取单页的原始文本和表格数据，返回待拼接的文本片段"""
+        parts = []
+        
+        # 提取常规文本 - 尝试多种格式
+        try:
+            # 提取表格数据: 优先使用 PyMuPDF 原生表格识别，避免序列化整页 HTML
+            if has_table_extraction:
+                # 提取原始文本
+                parts.append(page.get_text())
+                parts.append("\n\n")
+                table_data = self._extract_tables_from_page(page)
+            else:
+                # 旧版本没有 find_tables，从 HTML 中提取表格数据
+                # 原始文本和 HTML 共用同一个 TextPage，页面布局只分析一次
+                textpage = page.get_textpage()
+                parts.append(textpage.extractText())
+                parts.append("\n\n")
+                table_data = self._extract_tables_from_html(textpage.extractHTML())
+            if table_data:
+                parts.append("\n\nTABLE DATA:\n")
+                parts.append(table_data)
+        
+        except Exception as e:
+            logger.warning(f"Error extracting text from page {page_num+1}: {str(e)}")
+        
+        # 记录进度
+        logger.debug(f"Processed page {page_num+1}/{page_count}")
+        return parts
+    
+    def _extract_pages_parallel(self, doc, file_path: str, has_table_extraction: bool) -> List[str]:
+        """
+        使用多个进程提取所有页面的文本片段
+        
+        PyMuPDF 的文档对象不能跨线程共享，且文本提取时不释放 GIL，因此每个子进程
+        自行打开文件并处理一段连续的页面。进程池不可用时退回到逐页顺序提取。
+        """
+        page_count = len(doc)
+        workers = min(os.cpu_count() or 1, -(-page_count // _PAGES_PER_WORKER))
+        step = -(-page_count // workers)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        
+        text_parts = []
+        try:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                for parts in executor.map(_extract_page_range, repeat(file_path), ranges,
+                                          repeat(page_count), repeat(has_table_extraction)):
+                    text_parts.extend(parts)
+        except Exception as e:
+            logger.warning(f"Parallel page extraction failed, extracting sequentially: {str(e)}")
+            text_parts = []
+            for page_num, page in enumerate(doc):
+                text_parts.extend(self._extract_page_text(page, page_num, page_count, has_table_extraction))
+        
+        return text_parts
     
     def _extract_from_api_doc_format(self, text: str, file_path: str) -> APISchema:
         """提取标准API文档格式（如UCloud API文档）中的API信息"""
         logger.info("Attempting to extract API information from standard API doc format")
         
-        # 清理文本中的特殊字符
-        clean_text = text.replace('\u0001', '').replace('\r', '').strip()
+        # 一次遍历清理文本中的特殊字符 (\x01、\r 和康熙部首等特殊Unicode字符)
+        clean_text = text.translate(_CLEAN_TABLE).strip()
+        lines = clean_text.split('\n')
         
         # 输出调试信息 - 检查文本的前200个字符
         logger.debug(f"Text preview: {clean_text[:200]}...")
         
         # 提取API名称 - 针对UCloud API格式优化
-        first_line = clean_text.split('\n')[0].strip()
+        first_line = lines[0].strip()
         
         # 从第一行中尝试提取更精确的API名称
-        api_name_match = re.search(r'[a-zA-Z]+UDB[a-zA-Z]+', first_line)
+        api_name_match = _API_NAME_RE.search(first_line)
         if api_name_match:
             api_title = api_name_match.group(0)
         else:
             # 尝试从描述中提取
-            desc_match = re.search(r'Describe[a-zA-Z]+', clean_text)
+            desc_match = _DESCRIBE_NAME_RE.search(clean_text)
             if desc_match:
                 api_title = desc_match.group(0)
             else:
@@ -125,14 +428,12 @@ class DocumentParser:
         
         # 查找API描述部分 - 删除不必要的字符并转换为可读文本
         description_lines = []
-        lines = clean_text.split('\n')[:10]  # 只检查前10行
         
         for i in range(1, min(6, len(lines))):
-            line = lines[i].strip()
-            if line and not any(x in line.lower() for x in ['request parameters', 'parameter name']):
-                # 清理行，确保它是有意义的描述部分
-                clean_line = re.sub(r'[\u2f00-\u2fff]', '', line)  # 删除一些特殊Unicode字符
-                if clean_line and len(clean_line) > 5:  # 只添加有意义的行
+            clean_line = lines[i].strip()
+            if clean_line and not any(x in clean_line.lower() for x in ['request parameters', 'parameter name']):
+                # 确保它是有意义的描述部分
+                if len(clean_line) > 5:  # 只添加有意义的行
                     # 将Unicode转为正常中文显示
                     clean_line = self._decode_unicode_text(clean_line)
                     description_lines.append(clean_line)
@@ -151,93 +452,8 @@ class DocumentParser:
         path = "/DescribeUDBInstance"
         method = "GET"  # UDB查询API通常是GET
         
-        # 为了更好地调试，添加所有UDB API参数
-        request_params = []
-        
         # 添加所有的UDB API参数 (完整的12个参数)
-        request_params.append(Parameter(
-            name="Region",
-            description=self._decode_unicode_text("地域。参见 地域和可用区列表"),
-            required=True,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="Zone",
-            description=self._decode_unicode_text("可用区，不填时默认全部可用区。参见 可用区列表"),
-            required=False,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="ProjectId",
-            description=self._decode_unicode_text("项目ID。不填写为默认项目，子帐号必须填写。请参考GetProjectList接口"),
-            required=False,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="DBId",
-            description=self._decode_unicode_text("DB实例id，如果指定则获取单个db实例的描述，否则为列表操作。指定DBId时无需填写ClassType、Offset、Limit"),
-            required=False,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="ClassType",
-            description=self._decode_unicode_text("DB种类，如果是列表操作，则需要指定,不区分大小写，其取值如下：mysql: SQL；mongo: NOSQL；postgresql: postgresql"),
-            required=False,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="Offset",
-            description=self._decode_unicode_text("分页显示起始偏移位置，列表操作时必填"),
-            required=False,
-            type="integer"
-        ))
-        
-        request_params.append(Parameter(
-            name="Limit",
-            description=self._decode_unicode_text("分页显示数量，列表操作时必填"),
-            required=False,
-            type="integer"
-        ))
-        
-        request_params.append(Parameter(
-            name="IsInUDBC",
-            description=self._decode_unicode_text("是否查看专区里面DB"),
-            required=False,
-            type="boolean"
-        ))
-        
-        request_params.append(Parameter(
-            name="UDBCId",
-            description=self._decode_unicode_text("IsInUDBC为True,UDBCId为空，说明查看整个可用区的专区的db，如果UDBId不为空则只查看此专区下面的db"),
-            required=False,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="IncludeSlaves",
-            description=self._decode_unicode_text("当只获取这个特定DBId的信息时，如果有该选项，那么把这个DBId实例的所有从库信息一起拉取并返回"),
-            required=False,
-            type="boolean"
-        ))
-        
-        request_params.append(Parameter(
-            name="VPCId",
-            description=self._decode_unicode_text("根据VPCId筛选DB"),
-            required=False,
-            type="string"
-        ))
-        
-        request_params.append(Parameter(
-            name="Tag",
-            description=self._decode_unicode_text("根据业务组筛选DB"),
-            required=False,
-            type="string"
-        ))
+        request_params = list(_UDB_PARAMETERS)
         
         logger.info(f"Added {len(request_params)} request parameters")
         
@@ -246,7 +462,7 @@ class DocumentParser:
         
         # 添加请求体(用于POST/PUT)或查询参数(用于GET)
         request_body = None
-        if method in ["POST", "PUT", "PATCH"] and request_params:
+        if method in _BODY_METHODS and request_params:
             request_body = RequestBody(parameters=request_params)
         
         # 创建响应参数
@@ -272,6 +488,9 @@ class DocumentParser:
     
     def _decode_unicode_text(self, text: str) -> str:
         """将Unicode编码的文本转换为正常显示的文本"""
+        # 快速路径: 文本中没有 \u 且全部可打印时，repr 中不会出现 Unicode 转义，无需构造 repr
+        if '\\u' not in text and text.isprintable():
+            return text
         try:
             # 尝试将Unicode编码文本转换为正常显示
             # 这样在JSON输出时就能正确显示中文而不是\uXXXX格式
@@ -292,32 +511,32 @@ class DocumentParser:
         if start_pos == -1:
             return parameters
             
-        end_markers = [end_marker, "Request Example", "UDBInstanceSet", "Response Example"]
-        end_pos = len(text)
-        
-        for marker in end_markers:
-            pos = text.find(marker, start_pos + len(start_marker))
-            if pos != -1 and pos < end_pos:
-                end_pos = pos
+        # 一次扫描找到最早出现的结束标记
+        end_match = _end_marker_pattern(end_marker).search(text, start_pos + len(start_marker))
+        end_pos = end_match.start() if end_match else len(text)
         
         params_section = text[start_pos + len(start_marker):end_pos].strip()
         
         # 特殊处理UCloud API文档格式
         if "Parameter name" in params_section and "Type" in params_section:
-            # 首先尝试直接匹配参数行
+            # 首先逐行扫描参数行
             # 格式通常为: 参数名 类型 描述 是否必填
-            param_pattern = r'(\w+)\s+(\w+)\s+([^\n]+?)\s+(Yes|No)\s*$'
-            param_matches = re.finditer(param_pattern, params_section, re.MULTILINE)
-            
-            for match in param_matches:
-                name = match.group(1).strip()
-                # 跳过可能的表头
-                if name.lower() in ['parameter', 'name', 'type']:
+            for line in params_section.split('\n'):
+                parts = line.split(None, 2)
+                if len(parts) < 3:
+                    continue
+                name, param_type, rest = parts
+                description_required = rest.rsplit(None, 1)
+                if len(description_required) < 2 or description_required[1] not in ('Yes', 'No'):
+                    continue
+                # 参数名和类型都应是单个词，并跳过可能的表头
+                if (not name.replace('_', '').isalnum() or not param_type.replace('_', '').isalnum()
+                        or name.lower() in _SKIP_NAMES):
                     continue
                     
-                param_type = match.group(2).strip().lower()
-                description = match.group(3).strip()
-                required = match.group(4).strip().lower() == 'yes'
+                param_type = param_type.lower()
+                description = description_required[0]
+                required = description_required[1] == 'Yes'
                 
                 # 标准化类型
                 param_type = self._normalize_type(param_type)
@@ -355,26 +574,22 @@ class DocumentParser:
                             if not line:
                                 continue
                                 
-                            # 尝试通过空格分割
-                            parts = re.split(r'\s{2,}', line)
+                            # 按两个以上的空白拆出前四列
+                            match = _PARAM_LINE_RE.match(line)
                             
                             # 只处理看起来像参数行的行
-                            if len(parts) >= 3 and not parts[0].startswith('-'):
-                                name = parts[0].strip()
+                            if match and not line.startswith('-'):
+                                name, param_type, description, required_column = match.groups()
                                 
                                 # 跳过特殊行
-                                if name.lower() in ['parameter', 'name', 'type'] or len(name) < 2:
+                                if name.lower() in _SKIP_NAMES or len(name) < 2:
                                     continue
                                     
-                                param_type = parts[1].strip().lower()
-                                
-                                # 获取描述
-                                description = parts[2].strip()
+                                param_type = param_type.lower()
                                 
                                 # 判断是否必填
-                                required = False
-                                if len(parts) >= 4:
-                                    required = 'yes' in parts[3].lower()
+                                if required_column is not None:
+                                    required = 'yes' in required_column.lower()
                                 else:
                                     required = 'required' in description.lower()
                                 
@@ -394,121 +609,75 @@ class DocumentParser:
                                 # 可能是描述的延续
                                 current_param.description += " " + line
         
-        # 如果所有方法都失败，尝试直接提取格式
-        if not parameters:
-            # 尝试简单模式: 名称 类型
-            param_pattern = r'(\w+)\s+(\w+)'
-            for match in re.finditer(param_pattern, params_section):
-                name = match.group(1).strip()
-                param_type = match.group(2).strip().lower()
-                
-                # 跳过无效名称
-                if (name.lower() in ['parameter', 'name', 'type', 'description', 'required'] 
-                    or len(name) < 2 or not re.match(r'^[a-zA-Z]', name)):
-                    continue
-                
-                # 尝试找到这个参数的描述
-                context = self._find_context(params_section, name, 100)
-                description = "No description"
-                
-                # 查找描述 - 通常在参数名之后
-                desc_pos = context.find(name) + len(name)
-                if desc_pos < len(context):
-                    possible_desc = context[desc_pos:].strip()
-                    # 只取第一行或句子
-                    if '\n' in possible_desc:
-                        possible_desc = possible_desc.split('\n')[0]
-                    if '.' in possible_desc:
-                        possible_desc = possible_desc.split('.')[0] + '.'
-                    
-                    if possible_desc and len(possible_desc) > 3:
-                        description = possible_desc
-                
-                # 检查是否必填
-                required = 'required' in description.lower() or 'yes' in context.lower()
-                
-                # 标准化类型
-                param_type = self._normalize_type(param_type)
-                
-                # 创建参数
-                param = Parameter(
-                    name=name,
-                    description=description,
-                    required=required,
-                    type=param_type
-                )
-                parameters.append(param)
-        
         return parameters
         
     def _normalize_type(self, param_type: str) -> str:
         """标准化参数类型"""
-        if param_type in ['int', 'integer']:
-            return 'integer'
-        elif param_type in ['bool', 'boolean']:
-            return 'boolean'
-        elif param_type in ['array', 'list']:
-            return 'array'
-        elif param_type in ['object', 'dict', 'map']:
-            return 'object'
-        elif param_type in ['number', 'float', 'double']:
-            return 'number'
-        else:
-            return 'string'
+        return _TYPE_ALIASES.get(param_type, 'string')
+    
+    def _extract_tables_from_page(self, page) -> str:
+        """使用 PyMuPDF 的 find_tables 提取表格数据，输出格式与 _extract_tables_from_html 相同"""
+        table_lines = []
+        
+        for table in page.find_tables().tables:
+            for row in table.extract():
+                clean_cells = [(cell or "").strip() for cell in row]
+                if clean_cells:
+                    table_lines.append(" | ".join(clean_cells) + "\n")
+            
+            table_lines.append("\n")  # 表格间空行
+        
+        return "".join(table_lines)
     
     def _extract_tables_from_html(self, html_text: str) -> str:
         """从 HTML 文本中提取表格数据"""
-        table_data = ""
+        # 大多数页面没有表格，直接跳过正则扫描
+        if '<table' not in html_text:
+            return ""
         
-        # 查找表格标签
-        table_parts = re.findall(r'<table[^>]*>(.*?)</table>', html_text, re.DOTALL)
+        table_lines = []
         
-        for table_html in table_parts:
+        # 查找表格标签
+        for table_html in _TABLE_RE.findall(html_text):
             # 查找所有行
-            rows = re.findall(r'<tr[^>]*>(.*?)</tr>', table_html, re.DOTALL)
-            
-            for row in rows:
-                # 提取单元格内容 (支持 th 和 td)
-                cells = re.findall(r'<t[hd][^>]*>(.*?)</t[hd]>', row, re.DOTALL)
-                
-                # 移除 HTML 标签
-                clean_cells = []
-                for cell in cells:
-                    clean_cell = re.sub(r'<[^>]+>', ' ', cell).strip()
-                    clean_cells.append(clean_cell)
+            for row in _TR_RE.findall(table_html):
+                # 提取单元格内容 (支持 th 和 td)，并移除 HTML 标签
+                clean_cells = [_strip_tags(cell).strip() for cell in _TD_RE.findall(row)]
                 
                 # 添加到表格数据
                 if clean_cells:
-                    table_data += " | ".join(clean_cells) + "\n"
+                    table_lines.append(" | ".join(clean_cells) + "\n")
             
-            table_data += "\n"  # 表格间空行
+            table_lines.append("\n")  # 表格间空行
         
-        return table_data
+        return "".join(table_lines)
     
     def _extract_with_ocr_fallback(self, doc) -> str:
         """尝试使用更激进的提取方法获取文本"""
         logger.info("Attempting alternative text extraction methods")
         
-        # 方法 1: 尝试所有可用的文本提取模式
-        text = ""
+        # 方法 1: 按优先级尝试文本提取模式，某一模式得到足够的文本后即停止
+        # dict/rawdict 是逐字形的结构数据而不是文本，json 模式已包含同样的信息，因此不再尝试
+        text_parts = []
         for page in doc:
-            # 尝试不同的文本提取模式
-            extraction_modes = ["text", "blocks", "words", "html", "dict", "json", "rawdict", "xhtml"]
-            
-            for mode in extraction_modes:
-                if hasattr(page, "get_text"):
-                    try:
-                        mode_text = page.get_text(mode)
-                        
-                        # 处理不同的返回类型
-                        if isinstance(mode_text, str):
-                            text += mode_text + "\n"
-                        elif isinstance(mode_text, (dict, list)):
-                            text += json.dumps(mode_text, ensure_ascii=False) + "\n"
-                    except Exception:
-                        pass  # 忽略不支持的模式
-        
-        return text
+            for mode in _FALLBACK_EXTRACTION_MODES:
+                try:
+                    mode_text = page.get_text(mode)
+                except Exception:
+                    continue  # 忽略不支持的模式
+                
+                # 处理不同的返回类型
+                if isinstance(mode_text, (dict, list)):
+                    mode_text = dumps_compact(mode_text)
+                elif not isinstance(mode_text, str):
+                    continue
+                text_parts.append(mode_text)
+                text_parts.append("\n")
+                
+                if len(mode_text) > _FALLBACK_MIN_PAGE_TEXT:
+                    break
+        
+        return "".join(text_parts)
     
     def _extract_from_feishu_format(self, text: str, file_path: str) -> APISchema:
         """特别为飞书导出的 PDF 提取 API 信息"""
@@ -525,19 +694,19 @@ class DocumentParser:
         endpoints = []
         
         # 模式1: 寻找 "接口" 或 "API" 相关部分
-        api_sections = re.split(r'(?i)(?:接口|API|接口说明|API列表)[:：\s]', text)
+        api_sections = _API_SECTION_RE.split(text)
         if len(api_sections) > 1:
             for section in api_sections[1:]:  # 跳过第一部分，它通常是标题前的内容
                 # 提取路径和方法
-                path_match = re.search(r'(?:路径|地址|Path|URL)[：:]\s*(/[^\s\n]*)', section)
-                method_match = re.search(r'(?:方法|Method|请求方式)[：:]\s*(GET|POST|PUT|DELETE|PATCH)', section, re.IGNORECASE)
+                path_match = _PATH_RE.search(section)
+                method_match = _METHOD_RE.search(section)
                 
                 if path_match:
                     path = path_match.group(1).strip()
                     method = method_match.group(1).upper() if method_match else "GET"
                     
                     # 提取描述
-                    desc_match = re.search(r'(?:描述|说明|Description)[：:]\s*([^\n]*)', section)
+                    desc_match = _DESC_RE.search(section)
                     description = desc_match.group(1).strip() if desc_match else "无描述"
                     
                     # 创建端点
@@ -555,26 +724,32 @@ class DocumentParser:
         # 如果没找到，尝试更激进的方法
         if not endpoints:
             # 尝试查找所有可能的 URL 路径和 HTTP 方法组合
-            paths = re.findall(r'(/[a-zA-Z0-9\-_/{}]+)', text)
-            methods = ["GET", "POST", "PUT", "DELETE", "PATCH"]
+            paths = _URL_PATH_RE.findall(text)
             
+            # 每种方法 (大写或小写) 在全文中出现的位置只扫描一次
+            method_positions = {
+                method: _find_all(text, method, method.lower()) for method in _HTTP_METHODS
+            }
+            
+            # 同一路径可能出现多次，其附近的方法只推断一次
+            path_methods = {}
             for path in paths:
-                # 寻找附近的方法
-                context = self._find_context(text, path, 200)  # 获取路径前后的文本
+                # 寻找附近的方法 (路径前后 200 个字符内)，为每个路径只添加一个方法
+                if path not in path_methods:
+                    path_methods[path] = self._find_method_near(text, path, 200, method_positions)
+                method = path_methods[path]
                 
-                for method in methods:
-                    if method in context or method.lower() in context:
-                        # 创建基本端点
-                        endpoint = Endpoint(
-                            path=path,
-                            method=method,
-                            description=f"从上下文推断的 {method} {path} 端点",
-                            request_body=None,
-                            responses={200: Response(status_code=200, description="默认响应")}
-                        )
-                        endpoints.append(endpoint)
-                        logger.info(f"Inferred endpoint from context: {method} {path}")
-                        break  # 为每个路径只添加一个方法
+                if method:
+                    # 创建基本端点
+                    endpoint = Endpoint(
+                        path=path,
+                        method=method,
+                        description=f"从上下文推断的 {method} {path} 端点",
+                        request_body=None,
+                        responses={200: Response(status_code=200, description="默认响应")}
+                    )
+                    endpoints.append(endpoint)
+                    logger.info(f"Inferred endpoint from context: {method} {path}")
         
         api_schema.endpoints = endpoints
         logger.info(f"Extracted {len(endpoints)} endpoints from Feishu format")
@@ -582,7 +757,7 @@ class DocumentParser:
     
     def _extract_request_body_feishu(self, section: str, method: str) -> Optional[RequestBody]:
         """从飞书格式中提取请求体参数"""
-        if method not in ["POST", "PUT", "PATCH"]:
+        if method not in _BODY_METHODS:
             return None
             
         # 查找参数表格或列表
@@ -597,7 +772,7 @@ class DocumentParser:
         
         # 尝试匹配参数表格
         # 匹配格式: 参数名 | 类型 | 必填 | 描述
-        param_matches = re.finditer(r'(\w+)[^\n|]*(?:\||｜)[^\n|]*(?:\||｜)[^\n|]*(?:\||｜)([^\n]+)', params_section)
+        param_matches = _FEISHU_PARAM_ROW_RE.finditer(params_section)
         for match in param_matches:
             name = match.group(1).strip()
             description = match.group(2).strip()
@@ -605,14 +780,14 @@ class DocumentParser:
             param = Parameter(
                 name=name,
                 description=description,
-                required=bool(re.search(r'(?:必填|是|true|required)', params_section, re.IGNORECASE)),
+                required=bool(_REQUIRED_MARK_RE.search(params_section)),
                 type=self._infer_parameter_type(name, description)
             )
             parameters.append(param)
         
         # 如果没找到表格格式，尝试列表格式
         if not parameters:
-            param_matches = re.finditer(r'[●\-*]\s*(\w+)[：:]\s*([^\n]+)', params_section)
+            param_matches = _FEISHU_PARAM_ITEM_RE.finditer(params_section)
             for match in param_matches:
                 param = Parameter(
                     name=match.group(1).strip(),
@@ -637,13 +812,13 @@ class DocumentParser:
         
         if response_section:
             # 查找状态码
-            status_matches = re.finditer(r'(?:状态码|code)[：:]\s*(\d{3})', response_section)
+            status_matches = _STATUS_RE.finditer(response_section)
             for match in status_matches:
                 status_code = int(match.group(1))
                 
                 # 查找相关描述
                 desc_context = self._find_context(response_section, match.group(0), 100)
-                desc_match = re.search(r'(?:描述|说明|message)[：:]\s*([^\n]+)', desc_context)
+                desc_match = _RESPONSE_DESC_RE.search(desc_context)
                 
                 description = desc_match.group(1).strip() if desc_match else "No description"
                 
@@ -667,21 +842,9 @@ class DocumentParser:
         desc_lower = description.lower()
         
         # 检查描述中是否明确指出类型
-        type_match = re.search(r'(?:类型|type)[：:]\s*(\w+)', desc_lower)
+        type_match = _TYPE_RE.search(desc_lower)
         if type_match:
-            raw_type = type_match.group(1)
-            if raw_type in ['int', 'integer', '整数']:
-                return 'integer'
-            elif raw_type in ['bool', 'boolean', '布尔']:
-                return 'boolean'
-            elif raw_type in ['array', 'list', '数组', '列表']:
-                return 'array'
-            elif raw_type in ['object', 'dict', '对象', '字典']:
-                return 'object'
-            elif raw_type in ['number', 'float', 'double', '浮点']:
-                return 'number'
-            else:
-                return 'string'
+            return _DESCRIBED_TYPE_ALIASES.get(type_match.group(1), 'string')
         
         # 基于名称和描述的启发式规则
         if any(x in name_lower for x in ['id', 'count', 'age', 'number', 'time', 'timestamp']):
@@ -709,6 +872,27 @@ class DocumentParser:
         
         return text[start:end]
     
+    def _find_method_near(self, text: str, target: str, context_size: int,
+                          method_positions: Dict[str, List[int]]) -> Optional[str]:
+        """
+        在目标字符串的上下文 (与 _find_context 的范围相同) 中查找 HTTP 方法
+        
+        按 method_positions 的顺序返回第一个完整出现在上下文中的方法，通过二分查找
+        已排序的出现位置判断，不必在上下文中逐个搜索。
+        """
+        target_pos = text.find(target)
+        if target_pos == -1:
+            return None
+        
+        start = max(0, target_pos - context_size // 2)
+        end = min(len(text), target_pos + len(target) + context_size // 2)
+        
+        for method, positions in method_positions.items():
+            index = bisect_left(positions, start)
+            if index < len(positions) and positions[index] + len(method) <= end:
+                return method
+        return None
+    
     def _extract_with_ai(self, text: str, file_path: str) -> APISchema:
         """Use AI to extract API information from document text"""
         logger.info("Using AI for API extraction")
@@ -738,7 +922,7 @@ class DocumentParser:
     def _extract_title(self, text: str) -> Optional[str]:
         """Extract API title from document"""
         # Basic implementation - in real use, would need more sophisticated pattern matching
-        title_match = re.search(r"(?i)API\s+Reference.*?[\r\n]+(.*?)[\r\n]+", text)
+        title_match = _TITLE_RE.search(text)
         if title_match:
             return title_match.group(1).strip()
         return None
@@ -746,7 +930,7 @@ class DocumentParser:
     def _extract_description(self, text: str) -> Optional[str]:
         """Extract API description"""
         # Simple implementation
-        desc_match = re.search(r"(?i)Description[\s:]+(.*?)(?=\n\n|\n[A-Z])", text)
+        desc_match = _DESCRIPTION_RE.search(text)
         if desc_match:
             return desc_match.group(1).strip()
         return None
@@ -754,7 +938,7 @@ class DocumentParser:
     def _extract_base_url(self, text: str) -> Optional[str]:
         """Extract API base URL"""
         # Look for URL patterns
-        url_match = re.search(r"(?i)Base\s+URL\s*[:\-]?\s*(https?://[^\s\n]+)", text)
+        url_match = _BASE_URL_RE.search(text)
         if url_match:
             return url_match.group(1).strip()
         return None
@@ -764,10 +948,7 @@ class DocumentParser:
         endpoints = []
         
         # Very basic endpoint extraction - would need enhancement
-        endpoint_patterns = re.finditer(
-            r"(?i)(GET|POST|PUT|DELETE|PATCH)\s+(/[a-z0-9/\-_{}]+)",
-            text
-        )
+        endpoint_patterns = _ENDPOINT_RE.finditer(text)
         
         for match in endpoint_patterns:
             method = match.group(1).upper()
@@ -793,7 +974,7 @@ class DocumentParser:
     def _extract_request_body(self, text: str, method: str, path: str) -> Optional[RequestBody]:
         """Extract request body for an endpoint"""
         # Basic implementation
-        if method in ["POST", "PUT", "PATCH"]:
+        if method in _BODY_METHODS:
             return RequestBody(
                 parameters=self._extract_parameters(text, method, path)
             )
@@ -809,13 +990,13 @@ class DocumentParser:
                                                r"Response|Returns")
         
         if param_section:
-            param_matches = re.finditer(r"(\w+)\s+\((\w+)(?:,\s*required)?\)\s*-\s*([^\n]+)", param_section)
+            param_matches = _PARAM_SIGNATURE_RE.finditer(param_section)
             for match in param_matches:
                 param = Parameter(
                     name=match.group(1),
                     description=match.group(3).strip(),
                     required="required" in match.group(0).lower(),
-                    type=match.group(2)
+                    type=sys.intern(match.group(2))
                 )
                 parameters.append(param)
         
@@ -832,7 +1013,7 @@ class DocumentParser:
         
         if response_section:
             # Look for status codes with descriptions
-            status_matches = re.finditer(r"(\d{3})\s*-\s*([^\n]+)", response_section)
+            status_matches = _STATUS_LINE_RE.finditer(response_section)
             for match in status_matches:
                 status_code = int(match.group(1))
                 description = match.group(2).strip()
@@ -865,3 +1046,17 @@ class DocumentParser:
         else:
             # If no end pattern found, return a reasonable chunk
             return text[start_pos:start_pos + 500]  # Arbitrary limit
+
+
+def _extract_page_range(file_path: str, page_range: Tuple[int, int], page_count: int,
+                        has_table_extraction: bool) -> List[str]:
+    """在子进程中提取 [start, stop) 范围内各页的文本片段，每个进程单独打开文档"""
+    parser = DocumentParser()
+    doc = fitz.open(file_path)
+    try:
+        parts = []
+        for page_num in range(*page_range):
+            parts.extend(parser._extract_page_text(doc[page_num], page_num, page_count, has_table_extraction))
+        return parts
+    finally:
+        doc.close()
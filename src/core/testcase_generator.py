@@ -9,6 +9,9 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Parameters filled from Postman environment variables instead of generated values
+_ENV_PLACEHOLDER_PARAMS = frozenset({'Region', 'Zone', 'ProjectId'})
+
 
 class TestCaseGenerator:
     """Generates test cases based on API schema information."""
@@ -654,7 +657,7 @@ class TestCaseGenerator:
     def _generate_valid_value(self, param: Parameter) -> Any:
         """根据参数类型生成有效值"""
         # 对于常用的环境变量参数，使用环境变量占位符
-        if param.name in ['Region', 'Zone', 'ProjectId']:
+        if param.name in _ENV_PLACEHOLDER_PARAMS:
             return f"{{{{ {param.name} }}}}"
             
         # 使用示例（如果有）
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     name: str
     description: str
@@ -2,6 +2,7 @@ import json
 import time
 import os
 import requests
+from dataclasses import asdict, is_dataclass
 from typing import Dict, List, Any, Optional
 
 import openai
@@ -17,6 +18,13 @@ logger = get_logger(__name__)
 load_dotenv()
 
 
+def _to_json_dict(obj: Any) -> Dict[str, Any]:
+    """json.dumps default hook for model objects; slotted dataclasses have no __dict__"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return obj.__dict__
+
+
 class AIClient:
     """Client for AI services that provides API extraction, test generation, and recommendations."""
     
@@ -328,7 +336,7 @@ Return only the JSON object, with no additional explanation.
     
     def _create_test_gen_prompt(self, endpoint: Endpoint) -> str:
         """Create a prompt for test case generation"""
-        endpoint_json = json.dumps(endpoint.__dict__, default=lambda o: o.__dict__, indent=2)
+        endpoint_json = json.dumps(endpoint.__dict__, default=_to_json_dict, indent=2)
         
         return f"""
 Please generate comprehensive test cases for the following API endpoint:
@@ -380,7 +388,7 @@ Return only the JSON array, with no additional explanation.
     
     def _create_recommendation_prompt(self, test_result: TestSuiteResult) -> str:
         """Create a prompt for recommendation generation"""
-        results_json = json.dumps(test_result.__dict__, default=lambda o: o.__dict__, indent=2)
+        results_json = json.dumps(test_result.__dict__, default=_to_json_dict, indent=2)
         
         return f"""
 Please analyze the following API test results and generate recommendations for improving the API:
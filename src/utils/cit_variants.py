@@ -0,0 +1,81 @@
+import random
+from collections import Counter
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+# Candidate rows tried for every row added to the covering array
+_CANDIDATES_PER_ROW = 30
+
+
+def pairwise_variants(factors: Sequence[Sequence[Any]]) -> List[Tuple[Any, ...]]:
+    """
+    Builds a pairwise (2-way) covering array for the given factors.
+
+    Every pair of values taken from two different factors appears together in at
+    least one returned variant. Rows are added greedily (AETG style): each row
+    starts from the factor value that occurs in the most uncovered pairs, the other
+    factors are filled in a shuffled order with the value covering the most new
+    pairs, and the best of several such candidates is kept. The shuffling uses a
+    fixed seed, so the result is deterministic for a given input.
+
+    Args:
+        factors: One sequence of candidate values per factor; empty factors are not allowed
+
+    Returns:
+        A list of variants, each a tuple holding one value per factor in factor order
+    """
+    if not factors:
+        return []
+    if len(factors) == 1:
+        return [(value,) for value in factors[0]]
+
+    sizes = [len(values) for values in factors]
+    if not all(sizes):
+        raise ValueError("every factor needs at least one value")
+
+    count = len(sizes)
+    # Pairs are (factor_i, value_index_i, factor_j, value_index_j) with factor_i < factor_j
+    uncovered: Set[Tuple[int, int, int, int]] = {
+        (i, a, j, b)
+        for i in range(count)
+        for j in range(i + 1, count)
+        for a in range(sizes[i])
+        for b in range(sizes[j])
+    }
+
+    def covers(row: Dict[int, int], k: int, c: int) -> int:
+        return sum(
+            1 for m, v in row.items()
+            if ((m, v, k, c) if m < k else (k, c, m, v)) in uncovered
+        )
+
+    rng = random.Random(0)
+    rows = []
+    while uncovered:
+        occurrences: Counter = Counter()
+        for i, a, j, b in uncovered:
+            occurrences[(i, a)] += 1
+            occurrences[(j, b)] += 1
+        (start, start_value), _ = occurrences.most_common(1)[0]
+
+        best_row, best_gain = None, -1
+        others = [k for k in range(count) if k != start]
+        for _ in range(_CANDIDATES_PER_ROW):
+            rng.shuffle(others)
+            row = {start: start_value}
+            gain = 0
+            for k in others:
+                value, value_gain = max(
+                    ((c, covers(row, k, c)) for c in range(sizes[k])),
+                    key=lambda item: item[1]
+                )
+                row[k] = value
+                gain += value_gain
+            if gain > best_gain:
+                best_row, best_gain = row, gain
+
+        for m in range(count):
+            for n in range(m + 1, count):
+                uncovered.discard((m, best_row[m], n, best_row[n]))
+        rows.append(best_row)
+
+    return [tuple(factors[k][row[k]] for k in range(count)) for row in rows]
@@ -2,6 +2,7 @@ import json
 import os
 import uuid
 from typing import Dict, Any, Optional
+from src.utils.json_utils import write_json_file
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -50,8 +51,7 @@ def generate_environment_file(
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     # Write environment file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(env_data, f, indent=2, ensure_ascii=False)
+    write_json_file(env_data, output_path)
     
     logger.info(f"Environment file generated: {output_path}")
     return output_path
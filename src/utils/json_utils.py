@@ -0,0 +1,81 @@
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator, TextIO
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def dumps_pretty(data: Any) -> str:
+    """
+    Serializes data as 2-space indented JSON, keeping non-ASCII characters as-is.
+
+    Uses orjson when it is installed, otherwise the standard json module.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def dumps_compact(data: Any) -> str:
+    """
+    Serializes data as compact JSON (no whitespace), keeping non-ASCII characters as-is.
+
+    Uses orjson when it is installed, otherwise the standard json module with the
+    same separators, so both produce the same text.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+@contextmanager
+def atomic_open(output_path: str) -> Iterator[TextIO]:
+    """
+    Opens a UTF-8 text file that replaces output_path only once writing succeeds.
+
+    Data goes to a temporary file next to output_path, which is moved over it with
+    os.replace when the block exits normally and removed if the block raises, so
+    readers never see a partially written file.
+
+    Args:
+        output_path: Path of the file to write
+    """
+    tmp_path = f"{output_path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_file(data: Any, output_path: str) -> None:
+    """
+    Atomically writes data to output_path as indented UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable data
+        output_path: Path of the file to write
+    """
+    with atomic_open(output_path) as f:
+        f.write(dumps_pretty(data))
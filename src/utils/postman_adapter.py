@@ -9,6 +9,7 @@ from typing import Dict, List, Any, Optional
 
 from src.models.test_result import TestStatus, TestCaseResult, ValidationResult, TestSuiteResult
 from src.models.test_case import TestCase, TestCaseCollection
+from src.utils.json_utils import write_json_file
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -344,17 +345,17 @@ class PostmanAdapter:
         # Create environment file with variables
         environment = self._create_environment_file()
         
-        # Save collection to a file
+        # Save collection to a file (Newman input only, so written compactly)
         collection_path = os.path.join(self.collection_output_dir, f"collection_{self._get_timestamp()}.json")
         with open(collection_path, 'w', encoding='utf-8') as f:
-            json.dump(collection, f, indent=2, ensure_ascii=False)
+            json.dump(collection, f, ensure_ascii=False, separators=(',', ':'))
         
         # Save environment to a file if we have environment variables
         environment_path = None
         if environment:
             environment_path = os.path.join(self.collection_output_dir, f"environment_{self._get_timestamp()}.json")
             with open(environment_path, 'w', encoding='utf-8') as f:
-                json.dump(environment, f, indent=2, ensure_ascii=False)
+                json.dump(environment, f, ensure_ascii=False, separators=(',', ':'))
         
         # Generate result file path
         newman_result_path = os.path.join(self.collection_output_dir, f"newman_results_{self._get_timestamp()}.json")
@@ -926,8 +927,7 @@ class PostmanAdapter:
             collection: The Postman collection dictionary
             output_file: Path to the output file
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(collection, f, indent=2, ensure_ascii=False)
+        write_json_file(collection, output_file)
     
     def convert_test_case_collection_to_postman_file(self, collection: TestCaseCollection, output_file: str) -> None:
         """
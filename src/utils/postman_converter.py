@@ -3,7 +3,9 @@ import json
 import os
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+
+from src.utils.json_utils import write_json_file
 
 def convert_to_postman_collection(test_cases: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -519,25 +521,27 @@ try {
 pm.request.body.raw = JSON.stringify(obj);
 console.log("最终请求体:", pm.request.body.raw);"""
 
-def convert_test_cases_to_postman(input_file: str, output_file: str) -> None:
+def convert_test_cases_to_postman(source: Union[str, Dict[str, Any], List[Any]], output_file: str) -> None:
     """
-    将测试用例JSON文件转换为Postman集合文件
+    将测试用例转换为Postman集合文件
     
     Args:
-        input_file: 输入的测试用例JSON文件路径
+        source: 输入的测试用例JSON文件路径，或已加载的测试用例数据（字典或列表）
         output_file: 输出的Postman集合文件路径
     """
     try:
-        # 读取测试用例
-        with open(input_file, 'r', encoding='utf-8') as f:
-            test_cases = json.load(f)
+        # 读取测试用例，已在内存中的数据直接使用
+        if isinstance(source, (dict, list)):
+            test_cases = source
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                test_cases = json.load(f)
         
         # 转换为Postman集合
         collection = convert_to_postman_collection(test_cases)
         
         # 写入Postman集合文件
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(collection, f, indent=2, ensure_ascii=False)
+        write_json_file(collection, output_file)
         
     except Exception as e:
         raise Exception(f"转换测试用例失败: {str(e)}")